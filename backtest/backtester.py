@@ -13,7 +13,7 @@ import numpy as np
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestTrade:
     """Represents a backtested trade"""
 
@@ -255,42 +255,51 @@ class Backtester:
                 trades=[],
             )
 
+        # Pull P&L columns into arrays once; every metric below reads these
+        pnls = np.fromiter((t.pnl for t in trades), dtype=np.float64, count=len(trades))
+        fees = np.fromiter((t.fees for t in trades), dtype=np.float64, count=len(trades))
+        returns = np.fromiter(
+            (t.net_pnl for t in trades), dtype=np.float64, count=len(trades)
+        )
+
         # Basic metrics
         total_trades = len(trades)
-        winning_trades = len([t for t in trades if t.net_pnl > 0])
-        losing_trades = len([t for t in trades if t.net_pnl < 0])
+        win_mask = returns > 0
+        loss_mask = returns < 0
+        winning_trades = int(win_mask.sum())
+        losing_trades = int(loss_mask.sum())
         win_rate = winning_trades / total_trades if total_trades > 0 else 0
 
-        total_pnl = sum(t.pnl for t in trades)
-        total_fees = sum(t.fees for t in trades)
-        net_pnl = sum(t.net_pnl for t in trades)
+        total_pnl = pnls.sum()
+        total_fees = fees.sum()
+        net_pnl = returns.sum()
 
         # Win/Loss analysis
-        wins = [t.net_pnl for t in trades if t.net_pnl > 0]
-        losses = [t.net_pnl for t in trades if t.net_pnl < 0]
+        wins = returns[win_mask]
+        losses = returns[loss_mask]
 
-        avg_win = np.mean(wins) if wins else 0
-        avg_loss = np.mean(losses) if losses else 0
-        largest_win = max(wins) if wins else 0
-        largest_loss = min(losses) if losses else 0
+        avg_win = wins.mean() if wins.size else 0
+        avg_loss = losses.mean() if losses.size else 0
+        largest_win = wins.max() if wins.size else 0
+        largest_loss = losses.min() if losses.size else 0
 
         # Sharpe ratio (simplified - assumes daily returns)
-        returns = [t.net_pnl for t in trades]
+        std_return = returns.std()
         sharpe_ratio = (
-            np.mean(returns) / np.std(returns) * np.sqrt(252)
-            if len(returns) > 1 and np.std(returns) > 0
+            returns.mean() / std_return * np.sqrt(252)
+            if len(returns) > 1 and std_return > 0
             else 0
         )
 
         # Max drawdown
-        cumulative_pnl = np.cumsum([t.net_pnl for t in trades])
+        cumulative_pnl = np.cumsum(returns)
         running_max = np.maximum.accumulate(cumulative_pnl)
         drawdown = running_max - cumulative_pnl
         max_drawdown = np.max(drawdown) if len(drawdown) > 0 else 0
 
         # Profit factor
-        total_wins = sum(wins)
-        total_losses = abs(sum(losses))
+        total_wins = wins.sum()
+        total_losses = abs(losses.sum())
         profit_factor = total_wins / total_losses if total_losses > 0 else 0
 
         # Average latency (would need actual latency data)
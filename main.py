@@ -5,8 +5,10 @@ Orchestrates all components: news monitoring, edge detection, trade execution, p
 
 import asyncio
 import logging
+import queue
 import signal
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 import yaml
@@ -30,7 +32,7 @@ except ImportError:
     PatternDetector = None
 
 try:
-    from src.edge_detection.weather_model import WeatherModel
+    from src.edge_detection.weather_model import WeatherModel, close_client as close_weather_client
 except ImportError:
     WeatherModel = None
 
@@ -39,15 +41,27 @@ try:
 except ImportError:
     LLMNewsAnalyzer = None
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('/var/log/kalshi_trading/app.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Optional - libuv-based event loop (pulled in by uvicorn[standard]; not on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Configure logging - records are queued and written by a listener thread so
+# file/stdout I/O never blocks the event loop
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('/var/log/kalshi_trading/app.log'),
+    logging.StreamHandler(sys.stdout)
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue(-1)
+# The queue handler only merges args into the message; the real handlers format
+logging.basicConfig(level=logging.INFO, format='%(message)s', handlers=[QueueHandler(_log_queue)])
+log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+log_listener.start()
 
 logger = logging.getLogger(__name__)
 
@@ -306,7 +320,7 @@ class KalshiTradingSystem:
                 await self.position_manager.monitor_positions()
 
                 # Update metrics
-                summary = self.position_manager.get_position_summary()
+                summary = self.position_manager.get_position_summary(summary_only=True)
                 MetricsCollector.update_positions(
                     summary['total_positions'],
                     summary.get('total_value', 0),
@@ -422,6 +436,10 @@ class KalshiTradingSystem:
         await self.send_alert("🛑 Kalshi Trading System shutting down")
 
         # Close connections
+        await self.news_monitor.stop()
+        if self.weather_model:
+            await close_weather_client()
+        await self.kalshi.aclose()
         self.kalshi.close()
         self.db.close()
 
@@ -442,7 +460,10 @@ def main():
     signal.signal(signal.SIGINT, system.handle_signal)
     signal.signal(signal.SIGTERM, system.handle_signal)
 
-    # Run
+    # Run (on uvloop when available: cheaper task switches for message bursts)
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     try:
         asyncio.run(system.start())
     except KeyboardInterrupt:
@@ -450,6 +471,9 @@ def main():
     except Exception as e:
         logger.critical(f"Fatal error: {e}", exc_info=True)
         sys.exit(1)
+    finally:
+        # Flush queued log records before the process exits
+        log_listener.stop()
 
 
 if __name__ == "__main__":
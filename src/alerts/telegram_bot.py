@@ -71,7 +71,7 @@ class TelegramAlerter:
                 text=message,
                 parse_mode=parse_mode,
             )
-            logger.debug(f"Telegram message sent: {message[:50]}...")
+            logger.debug("Telegram message sent: %.50s...", message)
             return True
 
         except TelegramError as e:
@@ -3,13 +3,16 @@ Kalshi Exchange API Client
 Documentation: https://trading-api.readme.io/reference/getting-started
 """
 
+import asyncio
 import time
 import base64
 import hashlib
+import threading
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
 import logging
 import httpx
+from cachetools import TTLCache
 from tenacity import retry, stop_after_attempt, wait_exponential
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding
@@ -126,6 +129,11 @@ class KalshiClient:
         order = client.place_order("INXD-23DEC29-T4700", "yes", 10, 50)
     """
 
+    # get_markets(use_cache=True) results are reused this long. Opt-in only:
+    # trading paths price signals off the listing and need it fresh
+    MARKETS_CACHE_TTL_SECONDS = 5
+    MARKETS_CACHE_MAXSIZE = 128
+
     def __init__(
         self,
         api_key: str,
@@ -135,6 +143,8 @@ class KalshiClient:
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.client = httpx.Client(timeout=30.0)
+        # Pooled keep-alive client for the async API, created on first use
+        self._async_client: Optional[httpx.AsyncClient] = None
 
         # Parse RSA private key for request signing
         # Handle case where .env strips newlines - restore PEM format
@@ -173,17 +183,54 @@ class KalshiClient:
             raise
 
         # Rate limiting
-        self.last_request_time = 0
+        self.last_request_time = float("-inf")  # time.monotonic() of last slot
         self.min_request_interval = 0.1  # 100ms between requests
+        self._rate_limit_lock = threading.Lock()
+
+        # (status, limit, category) -> markets; cleared when we place/cancel orders
+        self._markets_cache: TTLCache = TTLCache(
+            maxsize=self.MARKETS_CACHE_MAXSIZE, ttl=self.MARKETS_CACHE_TTL_SECONDS
+        )
+        self._markets_cache_lock = threading.Lock()
 
         logger.info(f"Initialized Kalshi client for {base_url}")
 
+    def _reserve_request_slot(self) -> float:
+        """
+        Reserve the next request slot (safe across worker threads and tasks).
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        with self._rate_limit_lock:
+            # Monotonic clock: spacing must not shift with wall-clock adjustments
+            now = time.monotonic()
+            slot = max(now, self.last_request_time + self.min_request_interval)
+            self.last_request_time = slot
+            return slot - now
+
     def _rate_limit(self):
         """Enforce rate limiting between requests"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            time.sleep(self.min_request_interval - elapsed)
-        self.last_request_time = time.time()
+        delay = self._reserve_request_slot()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def _arate_limit(self):
+        """Enforce rate limiting between requests without blocking the event loop"""
+        delay = self._reserve_request_slot()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get the shared async HTTP client, creating it on first use"""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=100, max_keepalive_connections=20
+                ),
+            )
+        return self._async_client
 
     def _sign_request(self, method: str, path: str, timestamp_ms: int, body: str = "") -> str:
         """
@@ -274,11 +321,51 @@ class KalshiClient:
             logger.error(f"Request failed: {e}")
             raise
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+    )
+    async def _amake_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of _make_request using the pooled AsyncClient"""
+        await self._arate_limit()
+
+        url = f"{self.base_url}{endpoint}"
+
+        import json as json_module
+        body_str = json_module.dumps(json) if json else ""
+
+        headers = self._get_headers(method.upper(), endpoint, body_str)
+
+        try:
+            response = await self._get_async_client().request(
+                method=method,
+                url=url,
+                headers=headers,
+                params=params,
+                json=json,
+            )
+            response.raise_for_status()
+            return response.json()
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error {e.response.status_code}: {e.response.text}")
+            raise
+        except httpx.HTTPError as e:
+            logger.error(f"Request failed: {e}")
+            raise
+
     def get_markets(
         self,
         status: str = "open",
         limit: int = 100,
         category: Optional[str] = None,
+        use_cache: bool = False,
     ) -> List[Market]:
         """
         Fetch markets from Kalshi.
@@ -287,10 +374,19 @@ class KalshiClient:
             status: Market status (open, closed, settled)
             limit: Max number of markets to return
             category: Filter by category (e.g., 'economics', 'weather')
+            use_cache: Reuse a listing fetched within MARKETS_CACHE_TTL_SECONDS
+                (off by default; only for callers that tolerate stale prices)
 
         Returns:
             List of Market objects
         """
+        cache_key = (status, limit, category)
+        if use_cache:
+            with self._markets_cache_lock:
+                cached = self._markets_cache.get(cache_key)
+            if cached is not None:
+                return list(cached)
+
         params = {"status": status, "limit": limit}
         if category:
             params["category"] = category
@@ -298,13 +394,53 @@ class KalshiClient:
         try:
             data = self._make_request("GET", "/markets", params=params)
             markets = [Market(m) for m in data.get("markets", [])]
-            logger.debug(f"Fetched {len(markets)} markets")
-            return markets
+            logger.debug("Fetched %d markets", len(markets))
+            with self._markets_cache_lock:
+                self._markets_cache[cache_key] = markets
+            return list(markets)
 
         except Exception as e:
             logger.error(f"Failed to fetch markets: {e}")
             return []
 
+    def _invalidate_markets_cache(self):
+        """Drop cached market listings (our own orders can move prices)"""
+        with self._markets_cache_lock:
+            self._markets_cache.clear()
+
+    def get_markets_by_ticker(
+        self, tickers: List[str], batch_size: int = 100
+    ) -> Dict[str, Market]:
+        """
+        Fetch several markets by ticker with one request per batch.
+
+        Args:
+            tickers: Market tickers to fetch
+            batch_size: Max tickers per /markets request
+
+        Returns:
+            Dict of ticker -> Market for the markets that were found
+        """
+        unique = list(dict.fromkeys(tickers))
+        markets: Dict[str, Market] = {}
+
+        for i in range(0, len(unique), batch_size):
+            batch = unique[i : i + batch_size]
+            try:
+                data = self._make_request(
+                    "GET",
+                    "/markets",
+                    params={"tickers": ",".join(batch), "limit": len(batch)},
+                )
+                for m in data.get("markets", []):
+                    market = Market(m)
+                    markets[market.ticker] = market
+            except Exception as e:
+                logger.error(f"Failed to fetch markets {batch}: {e}")
+
+        logger.debug("Fetched %d/%d markets by ticker", len(markets), len(unique))
+        return markets
+
     def get_market(self, ticker: str) -> Optional[Market]:
         """Get specific market by ticker"""
         try:
@@ -315,6 +451,16 @@ class KalshiClient:
             logger.error(f"Failed to fetch market {ticker}: {e}")
             return None
 
+    async def aget_market(self, ticker: str) -> Optional[Market]:
+        """Async variant of get_market"""
+        try:
+            data = await self._amake_request("GET", f"/markets/{ticker}")
+            market = data.get("market")
+            return Market(market) if market else None
+        except Exception as e:
+            logger.error(f"Failed to fetch market {ticker}: {e}")
+            return None
+
     def get_orderbook(self, ticker: str, depth: int = 5) -> Optional[OrderBook]:
         """
         Get orderbook for a specific market.
@@ -355,6 +501,54 @@ class KalshiClient:
         Returns:
             Order object if successful
         """
+        payload = self._build_order_payload(
+            ticker, side, quantity, limit_price, order_type
+        )
+
+        try:
+            logger.info(f"Placing order: {quantity} {side} @ {limit_price} on {ticker}")
+            data = self._make_request("POST", "/portfolio/orders", json=payload)
+            self._invalidate_markets_cache()
+            order = data.get("order")
+            return Order(order) if order else None
+
+        except Exception as e:
+            logger.error(f"Failed to place order: {e}")
+            raise
+
+    async def aplace_order(
+        self,
+        ticker: str,
+        side: str,
+        quantity: int,
+        limit_price: int,
+        order_type: str = "limit",
+    ) -> Optional[Order]:
+        """Async variant of place_order"""
+        payload = self._build_order_payload(
+            ticker, side, quantity, limit_price, order_type
+        )
+
+        try:
+            logger.info(f"Placing order: {quantity} {side} @ {limit_price} on {ticker}")
+            data = await self._amake_request("POST", "/portfolio/orders", json=payload)
+            self._invalidate_markets_cache()
+            order = data.get("order")
+            return Order(order) if order else None
+
+        except Exception as e:
+            logger.error(f"Failed to place order: {e}")
+            raise
+
+    @staticmethod
+    def _build_order_payload(
+        ticker: str,
+        side: str,
+        quantity: int,
+        limit_price: int,
+        order_type: str,
+    ) -> Dict[str, Any]:
+        """Validate order inputs and build the /portfolio/orders payload"""
         # Validate inputs
         if side not in ["yes", "no"]:
             raise ValueError(f"Invalid side: {side}. Must be 'yes' or 'no'")
@@ -377,20 +571,13 @@ class KalshiClient:
             payload["yes_price"] = limit_price if side == "yes" else None
             payload["no_price"] = limit_price if side == "no" else None
 
-        try:
-            logger.info(f"Placing order: {quantity} {side} @ {limit_price} on {ticker}")
-            data = self._make_request("POST", "/portfolio/orders", json=payload)
-            order = data.get("order")
-            return Order(order) if order else None
-
-        except Exception as e:
-            logger.error(f"Failed to place order: {e}")
-            raise
+        return payload
 
     def cancel_order(self, order_id: str) -> bool:
         """Cancel a pending order"""
         try:
             self._make_request("DELETE", f"/portfolio/orders/{order_id}")
+            self._invalidate_markets_cache()
             logger.info(f"Cancelled order {order_id}")
             return True
         except Exception as e:
@@ -402,7 +589,7 @@ class KalshiClient:
         try:
             data = self._make_request("GET", "/portfolio/positions")
             positions = [Position(p) for p in data.get("positions", [])]
-            logger.debug(f"Fetched {len(positions)} positions")
+            logger.debug("Fetched %d positions", len(positions))
             return positions
         except Exception as e:
             logger.error(f"Failed to fetch positions: {e}")
@@ -422,7 +609,7 @@ class KalshiClient:
         try:
             data = self._make_request("GET", "/portfolio/orders", params=params)
             orders = [Order(o) for o in data.get("orders", [])]
-            logger.debug(f"Fetched {len(orders)} orders")
+            logger.debug("Fetched %d orders", len(orders))
             return orders
         except Exception as e:
             logger.error(f"Failed to fetch orders: {e}")
@@ -437,7 +624,7 @@ class KalshiClient:
         try:
             data = self._make_request("GET", "/portfolio/fills", params=params)
             fills = [Trade(f) for f in data.get("fills", [])]
-            logger.debug(f"Fetched {len(fills)} fills")
+            logger.debug("Fetched %d fills", len(fills))
             return fills
         except Exception as e:
             logger.error(f"Failed to fetch fills: {e}")
@@ -465,7 +652,7 @@ class KalshiClient:
                 "GET", f"/markets/{ticker}/history", params={"limit": limit}
             )
             history = data.get("history", [])
-            logger.debug(f"Fetched {len(history)} historical points for {ticker}")
+            logger.debug("Fetched %d historical points for %s", len(history), ticker)
             return history
         except Exception as e:
             logger.error(f"Failed to fetch history for {ticker}: {e}")
@@ -475,6 +662,12 @@ class KalshiClient:
         """Close the HTTP client"""
         self.client.close()
 
+    async def aclose(self):
+        """Close the async HTTP client, if it was created"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
     def __enter__(self):
         return self
 
@@ -125,7 +125,7 @@ class Trade(Base):
     executed_at = Column(DateTime, default=datetime.utcnow, index=True)
     closed_at = Column(DateTime, nullable=True)
     status = Column(
-        String(20), default="open"
+        String(20), default="open", index=True
     )  # 'open', 'closed', 'cancelled', 'failed'
     close_reason = Column(
         String(50), nullable=True
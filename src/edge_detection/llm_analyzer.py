@@ -21,6 +21,12 @@ from src.edge_detection.speed_arbitrage import TradeSignal
 
 logger = logging.getLogger(__name__)
 
+# Ticker fragments for Fed/economic markets (used to trim the prompt)
+RELEVANT_MARKET_PATTERNS = ('FED', 'RATE', 'CPI', 'INF', 'GDP', 'UNEMP', 'JOBS', 'NFP', 'FOMC')
+
+# Upper bound on memoized uppercase tickers before the cache is reset
+MAX_TICKER_CACHE_SIZE = 10000
+
 
 class LLMNewsAnalyzer:
     """
@@ -38,6 +44,9 @@ class LLMNewsAnalyzer:
         """
         self.enabled = enabled and ANTHROPIC_AVAILABLE
 
+        # Uppercased tickers, computed once per ticker instead of once per event
+        self._ticker_upper: Dict[str, str] = {}
+
         if not ANTHROPIC_AVAILABLE:
             logger.warning("anthropic library not installed - LLM analysis disabled")
             self.enabled = False
@@ -105,11 +114,17 @@ class LLMNewsAnalyzer:
         """Build analysis prompt for Claude"""
 
         # Filter markets to Fed/economic related (reduce noise)
-        relevant_market_patterns = ['FED', 'RATE', 'CPI', 'INF', 'GDP', 'UNEMP', 'JOBS', 'NFP', 'FOMC']
-        filtered_markets = [
-            m for m in available_markets
-            if any(pattern in m.upper() for pattern in relevant_market_patterns)
-        ]
+        ticker_upper = self._ticker_upper
+        if len(ticker_upper) > MAX_TICKER_CACHE_SIZE:
+            ticker_upper.clear()
+
+        filtered_markets = []
+        for m in available_markets:
+            upper = ticker_upper.get(m)
+            if upper is None:
+                upper = ticker_upper[m] = m.upper()
+            if any(pattern in upper for pattern in RELEVANT_MARKET_PATTERNS):
+                filtered_markets.append(m)
 
         market_list = "\n".join(filtered_markets[:50])  # Limit to 50 to save tokens
 
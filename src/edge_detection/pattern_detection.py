@@ -4,14 +4,60 @@ Identifies and exploits behavioral biases in prediction markets.
 """
 
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from datetime import datetime
+from typing import List, Dict, Optional, Tuple, Union
+import time
 import numpy as np
 
+# Optional: JIT-compile the vectorized market screens when numba is installed
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 from src.edge_detection.speed_arbitrage import TradeSignal
 
 logger = logging.getLogger(__name__)
 
+NS_PER_DAY = 86_400 * 1_000_000_000
+
+# Points without a timestamp sort first and always count as "older" data
+MISSING_TIMESTAMP_NS = np.iinfo(np.int64).min
+
+# Struct-of-arrays price history: (timestamps in epoch ns, prices), sorted by time
+PriceArrays = Tuple[np.ndarray, np.ndarray]
+
+LOW_LIQUIDITY_MIN_EDGE = 0.03  # 3% edge minimum
+
+
+def _scan_low_liquidity(bid, ask, volume, fair_value, max_volume, min_spread, min_edge):
+    """
+    Boolean mask of markets that pass every LowLiquidityDetector threshold.
+
+    NaN fair values never pass (NaN comparisons are False).
+    """
+    mid = (bid + ask) / 2
+    edge = np.abs(fair_value - mid)
+    return (volume <= max_volume) & (ask - bid >= min_spread) & (edge > min_edge)
+
+
+if NUMBA_AVAILABLE:
+    _scan_low_liquidity = njit(cache=True)(_scan_low_liquidity)
+
+
+def _point_timestamp_ns(point: Dict) -> int:
+    """Epoch-ns timestamp of a price point, or MISSING_TIMESTAMP_NS"""
+    ts = point.get("ts")
+    if ts is not None:
+        return ts
+
+    timestamp = point.get("timestamp")
+    if timestamp is None:
+        return MISSING_TIMESTAMP_NS
+
+    return int(timestamp.timestamp() * 1e9)
+
 
 class RecencyBiasDetector:
     """
@@ -23,31 +69,60 @@ class RecencyBiasDetector:
     def __init__(self, config: Dict):
         self.lookback_days = config.get("lookback_days", 7)
         self.reversal_threshold = config.get("reversal_threshold", 0.20)
+        self.lookback_ns = int(self.lookback_days * NS_PER_DAY)
+
+    @staticmethod
+    def to_arrays(price_history: List[Dict]) -> PriceArrays:
+        """
+        Convert a list of price points into timestamp-sorted (int64 ns,
+        float64) arrays.
+
+        Points are {'ts': int epoch ns, 'price': float} (already normalized at
+        ingestion, no datetime work) or {'timestamp': datetime, 'price': float}.
+        """
+        ts = np.array([_point_timestamp_ns(p) for p in price_history], dtype=np.int64)
+        prices = np.array([p["price"] for p in price_history], dtype=np.float64)
+
+        order = np.argsort(ts, kind="stable")
+        return ts[order], prices[order]
 
     def analyze_market(
-        self, ticker: str, price_history: List[Dict], current_price: float
+        self,
+        ticker: str,
+        price_history: Union[PriceArrays, List[Dict]],
+        current_price: float,
+        now_ts: Optional[float] = None,
+        now_dt: Optional[datetime] = None,
     ) -> Optional[TradeSignal]:
         """
         Analyze a market for recency bias.
 
         Args:
             ticker: Market ticker
-            price_history: List of {'timestamp': datetime, 'price': float}
+            price_history: (timestamps_ns, prices) arrays from to_arrays, or a
+                list of price points in either format to_arrays accepts
             current_price: Current market price
+            now_ts: Batch clock in epoch seconds (sampled here if omitted)
+            now_dt: Batch UTC datetime for signal timestamps
 
         Returns:
             Trade signal if opportunity found
         """
-        if len(price_history) < 10:
+        if isinstance(price_history, list):
+            price_history = self.to_arrays(price_history)
+
+        ts, prices = price_history
+
+        if len(ts) < 10:
             return None
 
-        # Calculate 7-day price change
-        cutoff = datetime.now() - timedelta(days=self.lookback_days)
-        recent_prices = [
-            p["price"]
-            for p in price_history
-            if p.get("timestamp", datetime.min) > cutoff
-        ]
+        # Split at the lookback cutoff (points exactly at the cutoff are in neither)
+        if now_ts is None:
+            now_ts = time.time()
+        cutoff_ns = int(now_ts * 1e9) - self.lookback_ns
+        older_end = np.searchsorted(ts, cutoff_ns, side="left")
+        recent_start = np.searchsorted(ts, cutoff_ns, side="right")
+        recent_prices = prices[recent_start:]
 
         if len(recent_prices) < 3:
             return None
@@ -59,16 +134,12 @@ class RecencyBiasDetector:
         # If moved >20% recently, bet on mean reversion
         if abs(price_change) > self.reversal_threshold:
             # Calculate historical mean (excluding recent spike)
-            older_prices = [
-                p["price"]
-                for p in price_history
-                if p.get("timestamp", datetime.min) < cutoff
-            ]
+            older_prices = prices[:older_end]
 
             if len(older_prices) < 5:
                 return None
 
-            historical_mean = np.mean(older_prices)
+            historical_mean = older_prices.mean()
 
             # Fair value is historical mean
             fair_value = historical_mean
@@ -91,21 +162,21 @@ class RecencyBiasDetector:
                            f"Current {current_price:.1%} vs historical mean {historical_mean:.1%}. " \
                            f"Betting on mean reversion."
 
-            signal = TradeSignal(
-                signal_id=f"recency_{ticker}_{datetime.now().timestamp()}",
-                timestamp=datetime.utcnow(),
-                source="recency_bias",
-                ticker=ticker,
-                side=side,
-                signal_type="BUY",
-                confidence=0.65,
-                edge_percentage=edge,
-                current_price=current_price,
-                fair_value=fair_value,
-                reasoning=reasoning,
+            signal = TradeSignal.make(
+                f"recency_{ticker}_{now_ts}",  # signal_id
+                now_dt or datetime.utcnow(),  # timestamp
+                "recency_bias",  # source
+                ticker,
+                side,
+                "BUY",  # signal_type
+                0.65,  # confidence
+                edge,  # edge_percentage
+                current_price,
+                fair_value,
+                reasoning,
             )
 
-            logger.info(f"Recency bias signal: {signal}")
+            logger.info("Recency bias signal: %s", signal)
             return signal
 
         return None
@@ -138,7 +209,7 @@ class FavoriteLongshotDetector:
             1 - self.extreme_threshold
         ):
             logger.debug(
-                f"Skipping {ticker}: extreme probability {current_price:.1%}"
+                "Skipping %s: extreme probability %.1f%%", ticker, current_price * 100
             )
             return None
 
@@ -151,6 +222,26 @@ class FavoriteLongshotDetector:
 
         return None  # Placeholder - would need more sophisticated modeling
 
+    def scan_markets(
+        self, tickers: List[str], prices: np.ndarray, volumes: np.ndarray
+    ) -> List[TradeSignal]:
+        """
+        Screen many markets at once; extreme probabilities are dropped with a
+        single array comparison and only the rest go through analyze_market.
+        """
+        extreme = (prices < self.extreme_threshold) | (
+            prices > 1 - self.extreme_threshold
+        )
+        logger.debug("Skipping %d markets with extreme probabilities", extreme.sum())
+
+        signals = []
+        for i in np.flatnonzero(~extreme):
+            signal = self.analyze_market(tickers[i], prices[i], volumes[i])
+            if signal:
+                signals.append(signal)
+
+        return signals
+
 
 class LowLiquidityDetector:
     """
@@ -170,6 +261,8 @@ class LowLiquidityDetector:
         ask_price: float,
         volume: float,
         fair_value: Optional[float] = None,
+        now_ts: Optional[float] = None,
+        now_dt: Optional[datetime] = None,
     ) -> Optional[TradeSignal]:
         """
         Identify low-liquidity opportunities.
@@ -180,10 +273,17 @@ class LowLiquidityDetector:
             ask_price: Best ask
             volume: 24h volume
             fair_value: Optional model-derived fair value
+            now_ts: Batch clock in epoch seconds (sampled here if omitted)
+            now_dt: Batch UTC datetime for signal timestamps
 
         Returns:
             Signal to provide liquidity at better mid-market price
         """
+        # Without a fair value there is nothing to trade against
+        # (providing liquidity at mid-price would be a market-making strategy)
+        if fair_value is None:
+            return None
+
         # Check if low volume
         if volume > self.min_volume_threshold:
             return None
@@ -194,36 +294,80 @@ class LowLiquidityDetector:
         if spread < self.min_spread_threshold:
             return None
 
-        # If we have a fair value estimate, use it
-        if fair_value is not None:
-            mid_price = (bid_price + ask_price) / 2
-            edge = abs(fair_value - mid_price)
-
-            if edge > 0.03:  # 3% edge minimum
-                side = "yes" if fair_value > mid_price else "no"
-
-                signal = TradeSignal(
-                    signal_id=f"liquidity_{ticker}_{datetime.now().timestamp()}",
-                    timestamp=datetime.utcnow(),
-                    source="low_liquidity",
-                    ticker=ticker,
-                    side=side,
-                    signal_type="BUY",
-                    confidence=0.60,
-                    edge_percentage=edge,
-                    current_price=mid_price,
-                    fair_value=fair_value,
-                    reasoning=f"Low liquidity market (vol=${volume:.0f}). "
-                    f"Wide spread {spread:.1%}. "
-                    f"Fair value {fair_value:.1%} vs mid {mid_price:.1%}",
-                )
+        mid_price = (bid_price + ask_price) / 2
+        edge = abs(fair_value - mid_price)
 
-                logger.info(f"Low liquidity signal: {signal}")
-                return signal
+        if edge <= LOW_LIQUIDITY_MIN_EDGE:
+            return None
 
-        # Even without fair value, can provide liquidity at better mid-price
-        # This is more of a market-making strategy
-        return None
+        side = "yes" if fair_value > mid_price else "no"
+
+        signal = TradeSignal.make(
+            f"liquidity_{ticker}_{now_ts or time.time()}",  # signal_id
+            now_dt or datetime.utcnow(),  # timestamp
+            "low_liquidity",  # source
+            ticker,
+            side,
+            "BUY",  # signal_type
+            0.60,  # confidence
+            edge,  # edge_percentage
+            mid_price,  # current_price
+            fair_value,
+            f"Low liquidity market (vol=${volume:.0f}). "
+            f"Wide spread {spread:.1%}. "
+            f"Fair value {fair_value:.1%} vs mid {mid_price:.1%}",  # reasoning
+        )
+
+        logger.info("Low liquidity signal: %s", signal)
+        return signal
+
+    def scan_markets(
+        self,
+        tickers: List[str],
+        bids: np.ndarray,
+        asks: np.ndarray,
+        volumes: np.ndarray,
+        fair_values: np.ndarray,
+        now_ts: Optional[float] = None,
+        now_dt: Optional[datetime] = None,
+    ) -> List[TradeSignal]:
+        """
+        Screen many markets at once; only hits go through analyze_market.
+
+        Args:
+            tickers: Market tickers
+            bids, asks, volumes: float64 arrays aligned with tickers
+            fair_values: float64 array of fair values (NaN if unknown)
+            now_ts, now_dt: Batch clock shared by every signal in the scan
+
+        Returns:
+            List of trade signals
+        """
+        mask = _scan_low_liquidity(
+            bids,
+            asks,
+            volumes,
+            fair_values,
+            self.min_volume_threshold,
+            self.min_spread_threshold,
+            LOW_LIQUIDITY_MIN_EDGE,
+        )
+
+        signals = []
+        for i in np.flatnonzero(mask):
+            signal = self.analyze_market(
+                tickers[i],
+                bids[i],
+                asks[i],
+                volumes[i],
+                fair_values[i],
+                now_ts=now_ts,
+                now_dt=now_dt,
+            )
+            if signal:
+                signals.append(signal)
+
+        return signals
 
 
 class PatternDetector:
@@ -255,54 +399,86 @@ class PatternDetector:
     def analyze_markets(
         self,
         market_data: List[Dict],
-        price_histories: Dict[str, List[Dict]],
+        price_histories: Dict[str, Union[PriceArrays, List[Dict]]],
     ) -> List[TradeSignal]:
         """
         Scan all markets for pattern-based opportunities.
 
         Args:
             market_data: List of market dicts with ticker, price, volume, bid, ask
-            price_histories: Dict of ticker -> price history
+                and an optional model-derived fair_value
+            price_histories: Dict of ticker -> price history, either as
+                (timestamps_ns, prices) arrays or a list of point dicts
 
         Returns:
             List of trade signals
         """
         signals = []
 
-        for market in market_data:
-            ticker = market.get("ticker")
-            current_price = market.get("price")
-            volume = market.get("volume", 0)
-            bid = market.get("bid", current_price - 0.05)
-            ask = market.get("ask", current_price + 0.05)
+        # Sample the clock once per scan rather than once per signal
+        now_ts = time.time()
+        now_dt = datetime.utcnow()
 
-            if not ticker or current_price is None:
-                continue
+        # Drop unusable rows once, then work column-wise
+        rows = [
+            m for m in market_data if m.get("ticker") and m.get("price") is not None
+        ]
+        if not rows:
+            logger.info("Pattern detector generated 0 signals")
+            return signals
+
+        tickers = [m["ticker"] for m in rows]
+        prices = np.array([m["price"] for m in rows], dtype=np.float64)
+        volumes = np.array([m.get("volume", 0) for m in rows], dtype=np.float64)
 
-            # Recency bias
-            if self.recency_detector:
-                price_history = price_histories.get(ticker, [])
+        # Recency bias (needs each ticker's own history)
+        if self.recency_detector:
+            for ticker, current_price in zip(tickers, prices):
                 signal = self.recency_detector.analyze_market(
-                    ticker, price_history, current_price
+                    ticker,
+                    price_histories.get(ticker, []),
+                    current_price,
+                    now_ts=now_ts,
+                    now_dt=now_dt,
                 )
                 if signal:
                     signals.append(signal)
 
-            # Favorite-longshot
-            if self.favorite_longshot_detector:
-                signal = self.favorite_longshot_detector.analyze_market(
-                    ticker, current_price, volume
-                )
-                if signal:
-                    signals.append(signal)
+        # Favorite-longshot
+        if self.favorite_longshot_detector:
+            signals.extend(
+                self.favorite_longshot_detector.scan_markets(tickers, prices, volumes)
+            )
+
+        # Low liquidity needs a fair value; skip markets without one
+        if self.low_liquidity_detector:
+            fair_values = np.array(
+                [m.get("fair_value", np.nan) for m in rows], dtype=np.float64
+            )
+            has_fair = np.flatnonzero(~np.isnan(fair_values))
 
-            # Low liquidity
-            if self.low_liquidity_detector:
-                signal = self.low_liquidity_detector.analyze_market(
-                    ticker, bid, ask, volume
+            if len(has_fair):
+                bids = np.array(
+                    [m.get("bid", np.nan) for m in rows], dtype=np.float64
+                )
+                asks = np.array(
+                    [m.get("ask", np.nan) for m in rows], dtype=np.float64
+                )
+                # Default to a 10-cent spread around the last price
+                bids = np.where(np.isnan(bids), prices - 0.05, bids)
+                asks = np.where(np.isnan(asks), prices + 0.05, asks)
+
+                signals.extend(
+                    self.low_liquidity_detector.scan_markets(
+                        [tickers[i] for i in has_fair],
+                        bids[has_fair],
+                        asks[has_fair],
+                        volumes[has_fair],
+                        fair_values[has_fair],
+                        now_ts=now_ts,
+                        now_dt=now_dt,
+                    )
                 )
-                if signal:
-                    signals.append(signal)
 
-        logger.info(f"Pattern detector generated {len(signals)} signals")
+        logger.info("Pattern detector generated %d signals", len(signals))
         return signals
@@ -6,6 +6,7 @@ Identifies and exploits pricing inefficiencies from news events before markets f
 import logging
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
@@ -13,8 +14,65 @@ from src.monitors.news_monitor import NewsEvent, EventType
 
 logger = logging.getLogger(__name__)
 
+# Economic data patterns, compiled once at import
+# Patterns like "CPI at 3.2%", "inflation rose to 4.5%"
+_CPI_PATTERNS = [
+    re.compile(r"cpi\s+(?:at|of|is|rose to|fell to)\s+([\d.]+)%", re.IGNORECASE),
+    re.compile(r"inflation\s+(?:at|is|rose to|fell to)\s+([\d.]+)%", re.IGNORECASE),
+    re.compile(r"consumer price index\s+(?:at|is)\s+([\d.]+)%", re.IGNORECASE),
+]
 
-@dataclass
+_UNEMPLOYMENT_PATTERNS = [
+    re.compile(r"unemployment\s+(?:rate\s+)?(?:at|is|rose to|fell to)\s+([\d.]+)%", re.IGNORECASE),
+    re.compile(r"jobless\s+(?:rate\s+)?(?:at|is)\s+([\d.]+)%", re.IGNORECASE),
+]
+
+_GDP_PATTERNS = [
+    re.compile(r"gdp\s+(?:growth\s+)?(?:at|is|grew|expanded)\s+([\d.]+)%", re.IGNORECASE),
+    re.compile(r"economic growth\s+(?:at|is)\s+([\d.]+)%", re.IGNORECASE),
+]
+
+
+@lru_cache(maxsize=128)
+def _combined_ticker_pattern(patterns: frozenset) -> "re.Pattern":
+    """Compile a set of ticker patterns into a single alternation regex"""
+    return re.compile(
+        "|".join(f"(?:{p})" for p in sorted(patterns)), re.IGNORECASE
+    )
+
+
+@lru_cache(maxsize=4096)
+def _market_direction(metric: Optional[str], ticker: str) -> str:
+    """
+    Direction a market should move for an economic data release.
+
+    Pure function of (metric, ticker), so results are cached across events.
+
+    Returns:
+        'up', 'down', or 'none'
+    """
+    # CPI markets: higher inflation = YES to "CPI above X%"
+    if "CPI" in ticker or "INF" in ticker:
+        if metric == "CPI":
+            return "up"  # Higher CPI increases probability
+
+    # Unemployment markets: higher unemployment = YES to "unemployment above X%"
+    if "UNEMP" in ticker or "JOBS" in ticker:
+        if metric == "UNEMPLOYMENT":
+            return "up"
+
+    # GDP markets: higher GDP = NO to "recession" or YES to "growth above X%"
+    if "GDP" in ticker:
+        if metric == "GDP":
+            if "RECESSION" in ticker:
+                return "down"  # Higher GDP = less recession risk
+            else:
+                return "up"  # Higher GDP = more growth
+
+    return "none"
+
+
+@dataclass(slots=True)
 class TradeSignal:
     """Represents a trading signal"""
 
@@ -31,6 +89,38 @@ class TradeSignal:
     reasoning: str  # Human-readable explanation
     event_data: Optional[Dict] = None
 
+    @classmethod
+    def make(
+        cls,
+        signal_id: str,
+        timestamp: datetime,
+        source: str,
+        ticker: str,
+        side: str,
+        signal_type: str,
+        confidence: float,
+        edge_percentage: float,
+        current_price: Optional[float],
+        fair_value: float,
+        reasoning: str,
+        event_data: Optional[Dict] = None,
+    ) -> "TradeSignal":
+        """Positional constructor for hot signal paths (skips kwargs binding)"""
+        return cls(
+            signal_id,
+            timestamp,
+            source,
+            ticker,
+            side,
+            signal_type,
+            confidence,
+            edge_percentage,
+            current_price,
+            fair_value,
+            reasoning,
+            event_data,
+        )
+
     def __repr__(self):
         return (
             f"Signal({self.ticker}, {self.signal_type} {self.side} @ "
@@ -47,18 +137,18 @@ class EconomicDataParser:
     UNEMPLOYMENT_IMPACT = 0.08  # 8% market move per 0.1% unemployment surprise
     GDP_IMPACT = 0.03  # 3% market move per 0.1% GDP surprise
 
+    # Probability change per 1.0 point of surprise, signed by direction
+    SURPRISE_IMPACT = {
+        "CPI": 10 * CPI_IMPACT_PER_TENTH,  # Higher CPI = higher inflation probability
+        "UNEMPLOYMENT": 10 * UNEMPLOYMENT_IMPACT,  # Higher unemployment = more likely recession
+        "GDP": -10 * GDP_IMPACT,  # Higher GDP = less likely recession (inverse)
+    }
+
     @staticmethod
     def extract_cpi_data(text: str) -> Optional[Dict]:
         """Extract CPI data from news text"""
-        # Patterns like "CPI at 3.2%", "inflation rose to 4.5%"
-        patterns = [
-            r"cpi\s+(?:at|of|is|rose to|fell to)\s+([\d.]+)%",
-            r"inflation\s+(?:at|is|rose to|fell to)\s+([\d.]+)%",
-            r"consumer price index\s+(?:at|is)\s+([\d.]+)%",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text.lower())
+        for pattern in _CPI_PATTERNS:
+            match = pattern.search(text)
             if match:
                 value = float(match.group(1))
                 return {"metric": "CPI", "value": value, "unit": "percent"}
@@ -68,13 +158,8 @@ class EconomicDataParser:
     @staticmethod
     def extract_unemployment_data(text: str) -> Optional[Dict]:
         """Extract unemployment data from news text"""
-        patterns = [
-            r"unemployment\s+(?:rate\s+)?(?:at|is|rose to|fell to)\s+([\d.]+)%",
-            r"jobless\s+(?:rate\s+)?(?:at|is)\s+([\d.]+)%",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text.lower())
+        for pattern in _UNEMPLOYMENT_PATTERNS:
+            match = pattern.search(text)
             if match:
                 value = float(match.group(1))
                 return {"metric": "UNEMPLOYMENT", "value": value, "unit": "percent"}
@@ -84,13 +169,8 @@ class EconomicDataParser:
     @staticmethod
     def extract_gdp_data(text: str) -> Optional[Dict]:
         """Extract GDP growth data from news text"""
-        patterns = [
-            r"gdp\s+(?:growth\s+)?(?:at|is|grew|expanded)\s+([\d.]+)%",
-            r"economic growth\s+(?:at|is)\s+([\d.]+)%",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text.lower())
+        for pattern in _GDP_PATTERNS:
+            match = pattern.search(text)
             if match:
                 value = float(match.group(1))
                 return {"metric": "GDP", "value": value, "unit": "percent"}
@@ -122,42 +202,63 @@ class EconomicDataParser:
         Returns:
             Expected probability change (e.g., 0.05 = 5% increase)
         """
-        surprise = actual - expected
-
-        if metric == "CPI":
-            # Higher CPI = higher inflation probability
-            return surprise * 10 * cls.CPI_IMPACT_PER_TENTH
-
-        elif metric == "UNEMPLOYMENT":
-            # Higher unemployment = more likely recession
-            return surprise * 10 * cls.UNEMPLOYMENT_IMPACT
-
-        elif metric == "GDP":
-            # Higher GDP = less likely recession
-            return -surprise * 10 * cls.GDP_IMPACT  # Negative because inverse
-
-        return 0.0
+        return (actual - expected) * cls.SURPRISE_IMPACT.get(metric, 0.0)
 
 
 class MarketMatcher:
     """Match news events to relevant Kalshi markets"""
 
-    # Keyword to ticker patterns
+    # Keyword to ticker patterns (frozensets: read-only, cheap to union)
     TICKER_PATTERNS = {
-        "cpi": [r"CPI-\d{2}[A-Z]{3}\d{2}", r"INF-\d{2}[A-Z]{3}\d{2}"],
-        "inflation": [r"INF-\d{2}[A-Z]{3}\d{2}", r"CPI-\d{2}[A-Z]{3}\d{2}"],
-        "unemployment": [r"UNEMP-\d{2}[A-Z]{3}\d{2}", r"JOBS-\d{2}[A-Z]{3}\d{2}"],
-        "gdp": [r"GDP-\d{2}Q\d"],
-        "nonfarm": [r"NFP-\d{2}[A-Z]{3}\d{2}"],
-        "fed": [r"FED-\d{2}[A-Z]{3}\d{2}", r"RATE-\d{2}[A-Z]{3}\d{2}"],
-        "hurricane": [r"HURRICANE-"],
-        "temperature": [r"TEMP-", r"HOT-", r"COLD-"],
-        "precipitation": [r"RAIN-", r"SNOW-"],
+        "cpi": frozenset({r"CPI-\d{2}[A-Z]{3}\d{2}", r"INF-\d{2}[A-Z]{3}\d{2}"}),
+        "inflation": frozenset({r"INF-\d{2}[A-Z]{3}\d{2}", r"CPI-\d{2}[A-Z]{3}\d{2}"}),
+        "unemployment": frozenset({r"UNEMP-\d{2}[A-Z]{3}\d{2}", r"JOBS-\d{2}[A-Z]{3}\d{2}"}),
+        "gdp": frozenset({r"GDP-\d{2}Q\d"}),
+        "nonfarm": frozenset({r"NFP-\d{2}[A-Z]{3}\d{2}"}),
+        "fed": frozenset({r"FED-\d{2}[A-Z]{3}\d{2}", r"RATE-\d{2}[A-Z]{3}\d{2}"}),
+        "hurricane": frozenset({r"HURRICANE-"}),
+        "temperature": frozenset({r"TEMP-", r"HOT-", r"COLD-"}),
+        "precipitation": frozenset({r"RAIN-", r"SNOW-"}),
     }
 
+    @staticmethod
+    def build_index(available_markets: List[str]) -> Dict[str, List[int]]:
+        """
+        Bucket a market snapshot by ticker segment.
+
+        Maps each uppercased segment that is followed by '-' (e.g. "KXCPI" in
+        "KXCPI-24JAN15-T3.0") to the positions of the tickers containing it.
+        Build once per snapshot and pass to find_related_markets.
+        """
+        index: Dict[str, List[int]] = {}
+        seen = set()
+        for position, ticker in enumerate(available_markets):
+            # Index only the first occurrence so lookups never return duplicates
+            if ticker in seen:
+                continue
+            seen.add(ticker)
+
+            for segment in ticker.upper().split("-")[:-1]:
+                index.setdefault(segment, []).append(position)
+        return index
+
+    @classmethod
+    def patterns_for_keywords(cls, keywords: List[str]) -> frozenset:
+        """Union of the ticker patterns implied by a list of event keywords"""
+        return frozenset().union(
+            *(
+                patterns
+                for keyword in keywords
+                if (patterns := cls.TICKER_PATTERNS.get(keyword.lower()))
+            )
+        )
+
     @classmethod
     def find_related_markets(
-        cls, event: NewsEvent, available_markets: List[str]
+        cls,
+        event: NewsEvent,
+        available_markets: List[str],
+        market_index: Optional[Dict[str, List[int]]] = None,
     ) -> List[str]:
         """
         Find Kalshi market tickers related to news event.
@@ -165,27 +266,45 @@ class MarketMatcher:
         Args:
             event: News event
             available_markets: List of all available market tickers
+            market_index: Optional build_index() result for available_markets;
+                restricts the regex check to tickers in matching buckets
 
         Returns:
             List of related market tickers
         """
-        related = []
-
-        # Get relevant patterns based on keywords
-        patterns_to_check = []
-        for keyword in event.keywords:
-            keyword_lower = keyword.lower()
-            if keyword_lower in cls.TICKER_PATTERNS:
-                patterns_to_check.extend(cls.TICKER_PATTERNS[keyword_lower])
-
-        # Match patterns against available markets
-        for market_ticker in available_markets:
-            for pattern in patterns_to_check:
-                if re.search(pattern, market_ticker, re.IGNORECASE):
-                    related.append(market_ticker)
-                    break
+        return cls.match_markets(
+            cls.patterns_for_keywords(event.keywords), available_markets, market_index
+        )
 
-        return related
+    @staticmethod
+    def match_markets(
+        patterns: frozenset,
+        available_markets: List[str],
+        market_index: Optional[Dict[str, List[int]]] = None,
+    ) -> List[str]:
+        """Return the unique tickers in available_markets matching any of patterns"""
+        if not patterns:
+            return []
+
+        # One regex pass per market instead of one per (market, pattern)
+        combined = _combined_ticker_pattern(patterns)
+
+        if market_index is None:
+            return [t for t in dict.fromkeys(available_markets) if combined.search(t)]
+
+        # Every pattern starts with a literal prefix followed by '-', so only
+        # tickers with a segment ending in one of those prefixes can match
+        prefixes = tuple(p.split("-", 1)[0] for p in patterns)
+        candidates = set()
+        for segment, positions in market_index.items():
+            if segment.endswith(prefixes):
+                candidates.update(positions)
+
+        return [
+            available_markets[i]
+            for i in sorted(candidates)
+            if combined.search(available_markets[i])
+        ]
 
 
 class SpeedArbitrage:
@@ -201,12 +320,25 @@ class SpeedArbitrage:
     6. Generate signal if edge exceeds threshold
     """
 
+    # For demo: assume expected values (in production, fetch from consensus)
+    CONSENSUS_VALUES = {
+        "CPI": 3.0,
+        "UNEMPLOYMENT": 3.8,
+        "GDP": 2.5,
+    }
+
     def __init__(self, config: Dict):
         self.config = config
         self.min_confidence = config.get("min_confidence", 0.70)
         self.min_edge = config.get("min_edge", 0.05)
         self.latency_target = config.get("latency_target_seconds", 10)
 
+        # Segment index for the last market snapshot seen, plus related-market
+        # results per pattern set so bursts of similar events skip the scan
+        self._indexed_markets: List[str] = []
+        self._market_index: Dict[str, List[int]] = {}
+        self._related_cache: Dict[frozenset, List[str]] = {}
+
         logger.info(
             f"Speed arbitrage initialized: min_confidence={self.min_confidence}, "
             f"min_edge={self.min_edge}"
@@ -229,10 +361,10 @@ class SpeedArbitrage:
         signals = []
 
         # Step 1: Find related markets
-        related_markets = MarketMatcher.find_related_markets(event, available_markets)
+        related_markets = self._find_related_markets(event, available_markets)
 
         if not related_markets:
-            logger.debug(f"No related markets found for event: {event.headline[:50]}")
+            logger.debug("No related markets found for event: %.50s", event.headline)
             return signals
 
         # Step 2: Parse event data
@@ -243,27 +375,24 @@ class SpeedArbitrage:
             event_data = EconomicDataParser.extract_economic_data(event.content)
 
             if event_data:
-                # For demo: assume expected values (in production, fetch from consensus)
-                expected_values = {
-                    "CPI": 3.0,
-                    "UNEMPLOYMENT": 3.8,
-                    "GDP": 2.5,
-                }
-
                 metric = event_data["metric"]
                 actual = event_data["value"]
-                expected = expected_values.get(metric, actual)
+                expected = self.CONSENSUS_VALUES.get(metric, actual)
 
                 expected_impact = EconomicDataParser.calculate_surprise_impact(
                     metric, actual, expected
                 )
 
                 logger.info(
-                    f"Economic data: {metric}={actual}% (expected {expected}%), "
-                    f"impact={expected_impact:.2%}"
+                    "Economic data: %s=%s%% (expected %s%%), impact=%.2f%%",
+                    metric,
+                    actual,
+                    expected,
+                    expected_impact * 100,
                 )
 
         # Step 3: Generate signals for each related market
+        now_dt = datetime.utcnow()
         for ticker in related_markets:
             current_price = market_prices.get(ticker)
 
@@ -302,28 +431,52 @@ class SpeedArbitrage:
                     continue
 
                 # Create signal
-                signal = TradeSignal(
-                    signal_id=f"speed_{event.event_id}_{ticker}",
-                    timestamp=datetime.utcnow(),
-                    source="speed_arbitrage",
-                    ticker=ticker,
-                    side=side,
-                    signal_type="BUY",
-                    confidence=confidence,
-                    edge_percentage=edge,
-                    current_price=current_price,
-                    fair_value=fair_value,
-                    reasoning=f"News: {event.headline[:100]}. "
+                signal = TradeSignal.make(
+                    f"speed_{event.event_id}_{ticker}",  # signal_id
+                    now_dt,  # timestamp
+                    "speed_arbitrage",  # source
+                    ticker,
+                    side,
+                    "BUY",  # signal_type
+                    confidence,
+                    edge,  # edge_percentage
+                    current_price,
+                    fair_value,
+                    f"News: {event.headline[:100]}. "
                     f"Expected {direction} movement of {abs(expected_impact):.1%}. "
-                    f"Current price {current_price:.2%} vs fair value {fair_value:.2%}",
-                    event_data=event_data,
+                    f"Current price {current_price:.2%} vs fair value {fair_value:.2%}",  # reasoning
+                    event_data,
                 )
 
                 signals.append(signal)
-                logger.info(f"Generated signal: {signal}")
+                logger.info("Generated signal: %s", signal)
 
         return signals
 
+    def _get_market_index(self, available_markets: List[str]) -> Dict[str, List[int]]:
+        """Return the segment index for a snapshot, rebuilding only when it changes"""
+        if available_markets != self._indexed_markets:
+            self._indexed_markets = list(available_markets)
+            self._market_index = MarketMatcher.build_index(available_markets)
+            self._related_cache = {}
+        return self._market_index
+
+    def _find_related_markets(
+        self, event: NewsEvent, available_markets: List[str]
+    ) -> List[str]:
+        """Related markets for an event, cached per pattern set and snapshot"""
+        market_index = self._get_market_index(available_markets)
+        patterns = MarketMatcher.patterns_for_keywords(event.keywords)
+
+        related = self._related_cache.get(patterns)
+        if related is None:
+            related = MarketMatcher.match_markets(
+                patterns, available_markets, market_index
+            )
+            self._related_cache[patterns] = related
+
+        return related
+
     def _determine_direction(
         self, ticker: str, event: NewsEvent, event_data: Optional[Dict]
     ) -> str:
@@ -336,24 +489,4 @@ class SpeedArbitrage:
         if not event_data:
             return "none"
 
-        metric = event_data.get("metric")
-
-        # CPI markets: higher inflation = YES to "CPI above X%"
-        if "CPI" in ticker or "INF" in ticker:
-            if metric == "CPI":
-                return "up"  # Higher CPI increases probability
-
-        # Unemployment markets: higher unemployment = YES to "unemployment above X%"
-        if "UNEMP" in ticker or "JOBS" in ticker:
-            if metric == "UNEMPLOYMENT":
-                return "up"
-
-        # GDP markets: higher GDP = NO to "recession" or YES to "growth above X%"
-        if "GDP" in ticker:
-            if metric == "GDP":
-                if "RECESSION" in ticker:
-                    return "down"  # Higher GDP = less recession risk
-                else:
-                    return "up"  # Higher GDP = more growth
-
-        return "none"
+        return _market_direction(event_data.get("metric"), ticker)
@@ -3,17 +3,116 @@ Weather Model Strategy
 Uses NOAA forecast data to predict weather outcomes and compare to market prices.
 """
 
+import asyncio
 import logging
+import math
+import re
+import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 import httpx
-from scipy import stats
+from cachetools import TTLCache
+from scipy.special import ndtr
 import numpy as np
 
+# Optional faster JSON decoding for large NOAA gridpoint payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.edge_detection.speed_arbitrage import TradeSignal
 
 logger = logging.getLogger(__name__)
 
+# Weather tickers: {PREFIX}-{CITY}-{YYMONDD}[-{B|L}{THRESHOLD}], e.g.
+# HIGHTEMP-NYC-23DEC15-B050 or RAIN-NYC-23DEC15
+_TEMP_TICKER_RE = re.compile(
+    r"^[^-]+-([^-]+)-(\d{2})([A-Z]{3})(\d{2})-([A-Z])(\d+(?:\.\d+)?)(?:-|$)"
+)
+_PRECIP_TICKER_RE = re.compile(r"^[^-]+-([^-]+)-(\d{2})([A-Z]{3})(\d{2})(?:-|$)")
+
+# 1/sqrt(2) for the erfc form of the standard normal CDF
+SQRT1_2 = 1.0 / math.sqrt(2.0)
+
+# Forecast uncertainty in °F assumed when a forecast carries no std
+DEFAULT_STD = 3.0
+
+MONTHS = {
+    "JAN": 1,
+    "FEB": 2,
+    "MAR": 3,
+    "APR": 4,
+    "MAY": 5,
+    "JUN": 6,
+    "JUL": 7,
+    "AUG": 8,
+    "SEP": 9,
+    "OCT": 10,
+    "NOV": 11,
+    "DEC": 12,
+}
+
+# Cap on in-flight NOAA requests when a scan fans out across markets
+MAX_CONCURRENT_REQUESTS = 20
+
+# Shared NOAA client so repeated fetches reuse pooled keep-alive connections
+_client: Optional[httpx.AsyncClient] = None
+_request_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared NOAA client, creating it on first use"""
+    global _client, _request_semaphore
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url="https://api.weather.gov",
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=10.0,
+        )
+        _request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    return _client
+
+
+async def _get(url: str) -> httpx.Response:
+    """GET through the shared client, at most MAX_CONCURRENT_REQUESTS at a time"""
+    client = get_client()
+    async with _request_semaphore:
+        return await client.get(url)
+
+
+def _json(response: httpx.Response) -> Dict:
+    """Decode a NOAA response body, using orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+async def close_client():
+    """Close the shared NOAA client (call on shutdown)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _values_on_date(values: List[Dict], target_date: datetime) -> np.ndarray:
+    """
+    Values from a NOAA gridpoint series whose validTime falls on target_date.
+
+    validTime is an ISO 8601 interval ("2023-12-15T06:00:00+00:00/PT1H"), so the
+    date is its first 10 characters; no datetime parsing needed.
+    """
+    day = target_date.date().isoformat()
+    return np.array(
+        [
+            value["value"]
+            for value in values
+            if value.get("validTime", "")[:10] == day and value.get("value") is not None
+        ],
+        dtype=np.float64,
+    )
+
 
 class WeatherDataFetcher:
     """Fetch weather data from NOAA APIs"""
@@ -21,16 +120,68 @@ class WeatherDataFetcher:
     FORECAST_URL = "https://api.weather.gov/gridpoints"
     STATIONS_URL = "https://api.weather.gov/stations"
 
+    # NOAA refreshes gridpoint forecasts roughly hourly
+    FORECAST_CACHE_TTL_SECONDS = 3600
+
+    # Grid metadata for a location is fixed, so point lookups are kept for the
+    # process lifetime. Both caches hold tasks so concurrent requests for the
+    # same key share one HTTP call.
+    _point_cache: Dict[Tuple[float, float], asyncio.Task] = {}
+    _forecast_cache = TTLCache(maxsize=256, ttl=FORECAST_CACHE_TTL_SECONDS)
+
+    @staticmethod
+    async def _cached(cache, key, fetch) -> Optional[Dict]:
+        """Await a shared fetch task for key, dropping failed (None) results"""
+        task = cache.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            cache[key] = task
+
+        result = await asyncio.shield(task)
+        if result is None and cache.get(key) is task:
+            del cache[key]
+        return result
+
+    @classmethod
+    async def get_city_forecast(cls, latitude: float, longitude: float) -> Optional[Dict]:
+        """
+        Get the quantitative gridpoint forecast for a location.
+
+        Returns:
+            Quantitative forecast payload, or None if NOAA lookups fail
+        """
+        point_data = await cls._cached(
+            cls._point_cache,
+            (latitude, longitude),
+            lambda: cls.get_point_data(latitude, longitude),
+        )
+
+        if not point_data:
+            return None
+
+        properties = point_data.get("properties", {})
+        grid_x = properties.get("gridX")
+        grid_y = properties.get("gridY")
+        office = properties.get("gridId")
+
+        if not all([grid_x, grid_y, office]):
+            return None
+
+        return await cls._cached(
+            cls._forecast_cache,
+            (office, grid_x, grid_y),
+            lambda: cls.get_quantitative_forecast(grid_x, grid_y, office),
+        )
+
     @staticmethod
     async def get_point_data(latitude: float, longitude: float) -> Optional[Dict]:
         """Get grid point data for a location"""
         url = f"https://api.weather.gov/points/{latitude},{longitude}"
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                return response.json()
+            response = await _get(url)
+            response.raise_for_status()
+            return _json(response)
         except Exception as e:
             logger.error(f"Error fetching point data: {e}")
             return None
@@ -41,10 +192,9 @@ class WeatherDataFetcher:
         url = f"https://api.weather.gov/gridpoints/{office}/{grid_x},{grid_y}/forecast"
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                return response.json()
+            response = await _get(url)
+            response.raise_for_status()
+            return _json(response)
         except Exception as e:
             logger.error(f"Error fetching forecast: {e}")
             return None
@@ -57,10 +207,9 @@ class WeatherDataFetcher:
         url = f"https://api.weather.gov/gridpoints/{office}/{grid_x},{grid_y}"
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                return response.json()
+            response = await _get(url)
+            response.raise_for_status()
+            return _json(response)
         except Exception as e:
             logger.error(f"Error fetching quantitative forecast: {e}")
             return None
@@ -69,6 +218,9 @@ class WeatherDataFetcher:
 class TemperaturePredictor:
     """Predict temperature outcomes for Kalshi temperature markets"""
 
+    # z-score sign per threshold direction; unknown directions give z=0 (p=0.5)
+    DIRECTION_SIGNS = {"above": -1.0, "below": 1.0}
+
     MAJOR_CITIES = {
         "NYC": {"lat": 40.7128, "lon": -74.0060, "name": "New York"},
         "LAX": {"lat": 34.0522, "lon": -118.2437, "name": "Los Angeles"},
@@ -92,23 +244,9 @@ class TemperaturePredictor:
 
         city = TemperaturePredictor.MAJOR_CITIES[city_code]
 
-        # Get point data
-        point_data = await WeatherDataFetcher.get_point_data(city["lat"], city["lon"])
-
-        if not point_data:
-            return None
-
-        properties = point_data.get("properties", {})
-        grid_x = properties.get("gridX")
-        grid_y = properties.get("gridY")
-        office = properties.get("gridId")
-
-        if not all([grid_x, grid_y, office]):
-            return None
-
-        # Get quantitative forecast
-        forecast_data = await WeatherDataFetcher.get_quantitative_forecast(
-            grid_x, grid_y, office
+        # Get quantitative forecast (cached per grid point)
+        forecast_data = await WeatherDataFetcher.get_city_forecast(
+            city["lat"], city["lon"]
         )
 
         if not forecast_data:
@@ -122,39 +260,24 @@ class TemperaturePredictor:
         if not values:
             return None
 
-        # Filter to target date
-        target_temps = []
-        for value in values:
-            valid_time = value.get("validTime", "")
-            # Parse ISO 8601 duration format
-            try:
-                time_str = valid_time.split("/")[0]
-                forecast_time = datetime.fromisoformat(time_str.replace("Z", "+00:00"))
-
-                if forecast_time.date() == target_date.date():
-                    temp_c = value.get("value")
-                    if temp_c is not None:
-                        # Convert Celsius to Fahrenheit
-                        temp_f = temp_c * 9 / 5 + 32
-                        target_temps.append(temp_f)
-            except:
-                continue
+        # Filter to target date and convert Celsius to Fahrenheit
+        target_temps = _values_on_date(values, target_date) * 1.8 + 32
 
-        if not target_temps:
+        if not target_temps.size:
             return None
 
         # Calculate statistics
-        high = max(target_temps)
-        low = min(target_temps)
-        mean = np.mean(target_temps)
-        std = np.std(target_temps) if len(target_temps) > 1 else 3.0  # Default 3°F uncertainty
+        high = target_temps.max()
+        low = target_temps.min()
+        mean = target_temps.mean()
+        std = target_temps.std() if target_temps.size > 1 else DEFAULT_STD
 
         return {
             "high": high,
             "low": low,
             "mean": mean,
             "std": std,
-            "num_forecasts": len(target_temps),
+            "num_forecasts": target_temps.size,
         }
 
     @staticmethod
@@ -173,21 +296,42 @@ class TemperaturePredictor:
             Probability (0-1)
         """
         mean = forecast["mean"]
-        std = forecast.get("std", 3.0)
+        std = forecast.get("std", DEFAULT_STD)
 
-        # Use normal distribution
+        # Use normal distribution; the scalar CDF is 0.5 * erfc(-z / sqrt(2)),
+        # which avoids ufunc dispatch (batches go through ndtr instead)
         if direction == "above":
             # P(X > threshold)
             z_score = (threshold - mean) / std
-            probability = 1 - stats.norm.cdf(z_score)
+            probability = 0.5 * math.erfc(z_score * SQRT1_2)
         elif direction == "below":
             # P(X < threshold)
             z_score = (threshold - mean) / std
-            probability = stats.norm.cdf(z_score)
+            probability = 0.5 * math.erfc(-z_score * SQRT1_2)
         else:
             probability = 0.5
 
-        return np.clip(probability, 0.01, 0.99)
+        return min(max(probability, 0.01), 0.99)
+
+    @staticmethod
+    def calculate_temperature_probabilities(
+        means: np.ndarray, stds: np.ndarray, thresholds: np.ndarray, signs: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized calculate_temperature_probability over a batch of markets.
+
+        Args:
+            means: Forecast mean temperatures in °F
+            stds: Forecast standard deviations in °F
+            thresholds: Temperature thresholds in °F
+            signs: DIRECTION_SIGNS value per market (-1 above, +1 below)
+
+        Returns:
+            Array of probabilities (0.01-0.99)
+        """
+        # P(X > t) = ndtr(-z), so one ndtr call covers both directions
+        z_scores = signs * (thresholds - means) / stds
+        return np.clip(ndtr(z_scores), 0.01, 0.99)
 
 
 class PrecipitationPredictor:
@@ -208,23 +352,9 @@ class PrecipitationPredictor:
 
         city = TemperaturePredictor.MAJOR_CITIES[city_code]
 
-        # Get point data
-        point_data = await WeatherDataFetcher.get_point_data(city["lat"], city["lon"])
-
-        if not point_data:
-            return None
-
-        properties = point_data.get("properties", {})
-        grid_x = properties.get("gridX")
-        grid_y = properties.get("gridY")
-        office = properties.get("gridId")
-
-        if not all([grid_x, grid_y, office]):
-            return None
-
-        # Get quantitative forecast
-        forecast_data = await WeatherDataFetcher.get_quantitative_forecast(
-            grid_x, grid_y, office
+        # Get quantitative forecast (cached per grid point)
+        forecast_data = await WeatherDataFetcher.get_city_forecast(
+            city["lat"], city["lon"]
         )
 
         if not forecast_data:
@@ -235,27 +365,56 @@ class PrecipitationPredictor:
         precip_prob_data = properties.get("probabilityOfPrecipitation", {})
         precip_values = precip_prob_data.get("values", [])
 
-        target_probs = []
-        for value in precip_values:
-            valid_time = value.get("validTime", "")
-            try:
-                time_str = valid_time.split("/")[0]
-                forecast_time = datetime.fromisoformat(time_str.replace("Z", "+00:00"))
-
-                if forecast_time.date() == target_date.date():
-                    prob = value.get("value")
-                    if prob is not None:
-                        target_probs.append(prob)
-            except:
-                continue
+        target_probs = _values_on_date(precip_values, target_date)
 
-        if not target_probs:
+        if not target_probs.size:
             return None
 
         # Take max probability for the day
-        max_prob = max(target_probs) / 100  # Convert from percent
+        max_prob = target_probs.max() / 100  # Convert from percent
 
-        return {"probability": max_prob, "num_forecasts": len(target_probs)}
+        return {"probability": max_prob, "num_forecasts": target_probs.size}
+
+
+def _temperature_confidence(
+    num_forecasts: Union[float, np.ndarray], stds: Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
+    """
+    Confidence from forecast quality; accepts scalars or arrays.
+
+    Base 0.7, +0.1 for >10 forecast points, +0.1 for low uncertainty
+    (std under 5°F), capped at 0.95.
+    """
+    return np.minimum(0.7 + 0.1 * (num_forecasts > 10) + 0.1 * (stds < 5), 0.95)
+
+
+def _score_temperature_batch(
+    means: np.ndarray,
+    stds: np.ndarray,
+    thresholds: np.ndarray,
+    signs: np.ndarray,
+    market_probs: np.ndarray,
+    num_forecasts: np.ndarray,
+    min_edge: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized probability, edge and confidence for a batch of temperature markets.
+
+    Mirrors WeatherModel._temperature_signal without building signals; both
+    share DEFAULT_STD and _temperature_confidence.
+
+    Returns:
+        (probabilities, edges, confidences, valid_mask) where valid_mask marks
+        markets whose edge meets min_edge
+    """
+    probabilities = TemperaturePredictor.calculate_temperature_probabilities(
+        means, stds, thresholds, signs
+    )
+    edges = np.abs(probabilities - market_probs)
+
+    confidences = _temperature_confidence(num_forecasts, stds)
+
+    return probabilities, edges, confidences, edges >= min_edge
 
 
 class WeatherModel:
@@ -268,6 +427,10 @@ class WeatherModel:
     - SNOW-{CITY}-{DATE} (will it snow)
     """
 
+    # Ticker prefixes routed to each analyzer
+    TEMP_PREFIXES = frozenset({"TEMP", "HIGHTEMP", "LOWTEMP", "HIGH", "LOW"})
+    PRECIP_PREFIXES = frozenset({"RAIN", "PRECIP"})
+
     def __init__(self, config: Dict):
         self.config = config
         self.min_edge = config.get("min_edge", 0.08)
@@ -278,78 +441,115 @@ class WeatherModel:
             f"horizon={self.forecast_horizon_days} days"
         )
 
+    def _target_date(
+        self, ticker: str, year: str, month: str, day: str, now_ts: float
+    ) -> Optional[datetime]:
+        """
+        Resolve a ticker date (23DEC15 = Dec 15, 2023) within the forecast horizon.
+
+        Args:
+            now_ts: Scan clock in epoch seconds
+
+        Returns:
+            Target date, or None if invalid or outside the horizon
+        """
+        month_num = MONTHS.get(month)
+        if not month_num:
+            return None
+
+        try:
+            target_date = datetime(2000 + int(year), month_num, int(day))
+        except ValueError as e:
+            logger.error(f"Error parsing date in ticker {ticker}: {e}")
+            return None
+
+        # Check if within forecast horizon
+        days_ahead = (target_date - datetime.fromtimestamp(now_ts)).days
+        if days_ahead < 0 or days_ahead > self.forecast_horizon_days:
+            return None
+
+        return target_date
+
     async def analyze_temperature_market(
-        self, ticker: str, current_price: float
+        self,
+        ticker: str,
+        current_price: float,
+        now_ts: Optional[float] = None,
+        now_dt: Optional[datetime] = None,
     ) -> Optional[TradeSignal]:
         """
         Analyze a temperature market.
 
         Example ticker: HIGHTEMP-NYC-23DEC15-B050 (NYC high temp above 50°F on Dec 15)
+
+        Args:
+            now_ts: Scan clock in epoch seconds (sampled here if omitted)
+            now_dt: Scan UTC datetime for signal timestamps
+        """
+        if now_ts is None:
+            now_ts = time.time()
+
+        inputs = await self._fetch_temperature_inputs(ticker, now_ts)
+        if not inputs:
+            return None
+
+        forecast, threshold, direction = inputs
+
+        # Calculate model probability
+        model_probability = TemperaturePredictor.calculate_temperature_probability(
+            forecast, threshold, direction
+        )
+
+        return self._temperature_signal(
+            ticker, current_price, forecast, model_probability, now_ts, now_dt
+        )
+
+    async def _fetch_temperature_inputs(
+        self, ticker: str, now_ts: float
+    ) -> Optional[Tuple[Dict, float, str]]:
+        """
+        Parse a temperature ticker and fetch its forecast.
+
+        Returns:
+            (forecast, threshold, direction), or None if the ticker is out of
+            scope or no forecast is available
         """
         # Parse ticker
-        parts = ticker.split("-")
-        if len(parts) < 4:
+        match = _TEMP_TICKER_RE.match(ticker)
+        if not match:
             return None
 
-        # Extract city, date, threshold
-        try:
-            city_code = parts[1]
-            date_str = parts[2]
-            threshold_str = parts[3]
-
-            # Parse date (format: 23DEC15 = Dec 15, 2023)
-            year = 2000 + int(date_str[0:2])
-            month_str = date_str[2:5]
-            day = int(date_str[5:7])
-
-            month_map = {
-                "JAN": 1,
-                "FEB": 2,
-                "MAR": 3,
-                "APR": 4,
-                "MAY": 5,
-                "JUN": 6,
-                "JUL": 7,
-                "AUG": 8,
-                "SEP": 9,
-                "OCT": 10,
-                "NOV": 11,
-                "DEC": 12,
-            }
-            month = month_map.get(month_str)
-
-            if not month:
-                return None
-
-            target_date = datetime(year, month, day)
-
-            # Check if within forecast horizon
-            days_ahead = (target_date - datetime.now()).days
-            if days_ahead < 0 or days_ahead > self.forecast_horizon_days:
-                return None
-
-            # Parse threshold (B050 = above 50°F, L050 = below 50°F)
-            direction = "above" if threshold_str.startswith("B") else "below"
-            threshold = float(threshold_str[1:])
+        city_code, year, month, day, direction_code, threshold_str = match.groups()
 
-        except Exception as e:
-            logger.error(f"Error parsing temperature ticker {ticker}: {e}")
+        target_date = self._target_date(ticker, year, month, day, now_ts)
+        if not target_date:
             return None
 
+        # Parse threshold (B050 = above 50°F, L050 = below 50°F)
+        direction = "above" if direction_code == "B" else "below"
+        threshold = float(threshold_str)
+
         # Get forecast
         forecast = await TemperaturePredictor.get_temperature_forecast(
             city_code, target_date
         )
 
         if not forecast:
-            logger.debug(f"No forecast available for {ticker}")
+            logger.debug("No forecast available for %s", ticker)
             return None
 
-        # Calculate model probability
-        model_probability = TemperaturePredictor.calculate_temperature_probability(
-            forecast, threshold, direction
-        )
+        return forecast, threshold, direction
 
+    def _temperature_signal(
+        self,
+        ticker: str,
+        current_price: float,
+        forecast: Dict,
+        model_probability: float,
+        now_ts: float,
+        now_dt: Optional[datetime] = None,
+    ) -> Optional[TradeSignal]:
+        """Build a temperature signal if the model probability has enough edge"""
         # Compare to market price
         market_probability = current_price
 
@@ -359,36 +559,47 @@ class WeatherModel:
         if edge < self.min_edge:
             return None
 
-        # Determine side to trade
-        if model_probability > market_probability:
-            side = "yes"
-            signal_type = "BUY"
-        else:
-            side = "no"
-            signal_type = "BUY"
-
         # Calculate confidence based on forecast quality
-        confidence = 0.7  # Base confidence
-        if forecast.get("num_forecasts", 0) > 10:
-            confidence += 0.1
-        if forecast.get("std", 10) < 5:  # Low uncertainty
-            confidence += 0.1
+        confidence = float(
+            _temperature_confidence(
+                forecast.get("num_forecasts", 0), forecast.get("std", DEFAULT_STD)
+            )
+        )
 
-        confidence = min(confidence, 0.95)
+        return self._build_temperature_signal(
+            ticker, current_price, forecast, model_probability, edge, confidence, now_ts, now_dt
+        )
+
+    def _build_temperature_signal(
+        self,
+        ticker: str,
+        current_price: float,
+        forecast: Dict,
+        model_probability: float,
+        edge: float,
+        confidence: float,
+        now_ts: float,
+        now_dt: Optional[datetime] = None,
+    ) -> TradeSignal:
+        """Create a temperature signal from already-scored inputs"""
+        market_probability = current_price
+
+        # Determine side to trade (always a buy of the underpriced side)
+        side = "yes" if model_probability > market_probability else "no"
 
         # Create signal
         signal = TradeSignal(
-            signal_id=f"weather_{ticker}_{datetime.now().timestamp()}",
-            timestamp=datetime.utcnow(),
+            signal_id=f"weather_{ticker}_{now_ts}",
+            timestamp=now_dt or datetime.utcnow(),
             source="weather_model",
             ticker=ticker,
             side=side,
-            signal_type=signal_type,
+            signal_type="BUY",
             confidence=confidence,
             edge_percentage=edge,
             current_price=market_probability,
             fair_value=model_probability,
-            reasoning=f"Weather model: {forecast['mean']:.1f}°F ±{forecast.get('std', 3):.1f}°F. "
+            reasoning=f"Weather model: {forecast['mean']:.1f}°F ±{forecast.get('std', DEFAULT_STD):.1f}°F. "
             f"Model probability {model_probability:.1%} vs market {market_probability:.1%}. "
             f"Edge: {edge:.1%}",
             event_data=forecast,
@@ -398,55 +609,32 @@ class WeatherModel:
         return signal
 
     async def analyze_precipitation_market(
-        self, ticker: str, current_price: float
+        self,
+        ticker: str,
+        current_price: float,
+        now_ts: Optional[float] = None,
+        now_dt: Optional[datetime] = None,
     ) -> Optional[TradeSignal]:
         """
         Analyze a precipitation market.
 
         Example ticker: RAIN-NYC-23DEC15 (will it rain in NYC on Dec 15)
+
+        Args:
+            now_ts: Scan clock in epoch seconds (sampled here if omitted)
+            now_dt: Scan UTC datetime for signal timestamps
         """
-        # Similar logic to temperature
-        parts = ticker.split("-")
-        if len(parts) < 3:
+        if now_ts is None:
+            now_ts = time.time()
+
+        match = _PRECIP_TICKER_RE.match(ticker)
+        if not match:
             return None
 
-        try:
-            city_code = parts[1]
-            date_str = parts[2]
-
-            # Parse date
-            year = 2000 + int(date_str[0:2])
-            month_str = date_str[2:5]
-            day = int(date_str[5:7])
-
-            month_map = {
-                "JAN": 1,
-                "FEB": 2,
-                "MAR": 3,
-                "APR": 4,
-                "MAY": 5,
-                "JUN": 6,
-                "JUL": 7,
-                "AUG": 8,
-                "SEP": 9,
-                "OCT": 10,
-                "NOV": 11,
-                "DEC": 12,
-            }
-            month = month_map.get(month_str)
-
-            if not month:
-                return None
-
-            target_date = datetime(year, month, day)
-
-            # Check if within forecast horizon
-            days_ahead = (target_date - datetime.now()).days
-            if days_ahead < 0 or days_ahead > self.forecast_horizon_days:
-                return None
+        city_code, year, month, day = match.groups()
 
-        except Exception as e:
-            logger.error(f"Error parsing precipitation ticker {ticker}: {e}")
+        target_date = self._target_date(ticker, year, month, day, now_ts)
+        if not target_date:
             return None
 
         # Get forecast
@@ -468,17 +656,14 @@ class WeatherModel:
             return None
 
         # Determine side
-        if model_probability > market_probability:
-            side = "yes"
-        else:
-            side = "no"
+        side = "yes" if model_probability > market_probability else "no"
 
         # Confidence
         confidence = 0.75
 
         signal = TradeSignal(
-            signal_id=f"weather_{ticker}_{datetime.now().timestamp()}",
-            timestamp=datetime.utcnow(),
+            signal_id=f"weather_{ticker}_{now_ts}",
+            timestamp=now_dt or datetime.utcnow(),
             source="weather_model",
             ticker=ticker,
             side=side,
@@ -508,25 +693,104 @@ class WeatherModel:
         Returns:
             List of trade signals
         """
-        signals = []
+        # One clock sample shared by every market in the scan
+        now_ts = time.time()
+        now_dt = datetime.utcnow()
+
+        temp_tickers = []
+        precip_tickers = []
 
         for ticker in markets:
             # Skip if no price data
             if ticker not in market_prices:
                 continue
 
-            current_price = market_prices[ticker]
+            # Bucket by market type
+            prefix = ticker.partition("-")[0]
+            if prefix in self.TEMP_PREFIXES:
+                temp_tickers.append(ticker)
+
+            elif prefix in self.PRECIP_PREFIXES:
+                precip_tickers.append(ticker)
+
+        # Fetch all forecasts concurrently; NOAA requests are capped by the
+        # shared client's semaphore
+        results = await asyncio.gather(
+            *(self._fetch_temperature_inputs(ticker, now_ts) for ticker in temp_tickers),
+            *(
+                self.analyze_precipitation_market(
+                    ticker, market_prices[ticker], now_ts, now_dt
+                )
+                for ticker in precip_tickers
+            ),
+            return_exceptions=True,
+        )
+
+        for ticker, result in zip(temp_tickers + precip_tickers, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error analyzing weather market {ticker}: {result}")
+
+        # Temperature markets are scored in one batch
+        temp_markets = [
+            (ticker, market_prices[ticker], *inputs)
+            for ticker, inputs in zip(temp_tickers, results[: len(temp_tickers)])
+            if inputs and not isinstance(inputs, Exception)
+        ]
 
-            # Analyze based on market type
-            if "TEMP" in ticker or "HIGH" in ticker or "LOW" in ticker:
-                signal = await self.analyze_temperature_market(ticker, current_price)
-                if signal:
-                    signals.append(signal)
+        signals = [
+            signal
+            for signal in results[len(temp_tickers) :]
+            if signal and not isinstance(signal, Exception)
+        ]
 
-            elif "RAIN" in ticker or "PRECIP" in ticker:
-                signal = await self.analyze_precipitation_market(ticker, current_price)
-                if signal:
-                    signals.append(signal)
+        if temp_markets:
+            signals.extend(self._score_temperature_markets(temp_markets, now_ts, now_dt))
 
         logger.info(f"Weather model generated {len(signals)} signals")
         return signals
+
+    def _score_temperature_markets(
+        self,
+        temp_markets: List[Tuple[str, float, Dict, float, str]],
+        now_ts: float,
+        now_dt: datetime,
+    ) -> List[TradeSignal]:
+        """
+        Score fetched temperature markets with a single vectorized CDF call.
+
+        Args:
+            temp_markets: (ticker, current_price, forecast, threshold, direction)
+                tuples from _fetch_temperature_inputs
+            now_ts, now_dt: Scan clock shared by every signal
+
+        Returns:
+            List of trade signals
+        """
+        signs = TemperaturePredictor.DIRECTION_SIGNS
+        probabilities, edges, confidences, valid = _score_temperature_batch(
+            np.array([m[2]["mean"] for m in temp_markets], dtype=np.float64),
+            np.array([m[2].get("std", DEFAULT_STD) for m in temp_markets], dtype=np.float64),
+            np.array([m[3] for m in temp_markets], dtype=np.float64),
+            np.array([signs.get(m[4], 0.0) for m in temp_markets], dtype=np.float64),
+            np.array([m[1] for m in temp_markets], dtype=np.float64),
+            np.array([m[2].get("num_forecasts", 0) for m in temp_markets], dtype=np.float64),
+            self.min_edge,
+        )
+
+        signals = []
+        for i in np.flatnonzero(valid).tolist():
+            ticker, current_price, forecast, _, _ = temp_markets[i]
+            signals.append(
+                self._build_temperature_signal(
+                    ticker,
+                    current_price,
+                    forecast,
+                    float(probabilities[i]),
+                    float(edges[i]),
+                    float(confidences[i]),
+                    now_ts,
+                    now_dt,
+                )
+            )
+
+        return signals
@@ -3,16 +3,26 @@ Position Manager
 Monitors and manages open positions, handles exits based on profit targets, stop losses, etc.
 """
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Optional
 
-from src.api.kalshi_client import KalshiClient
+import numpy as np
+
+from src.api.kalshi_client import KalshiClient, Market
 from src.database.models import Trade, Position as DBPosition
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=2048)
+def _parse_close_time(close_time: str) -> datetime:
+    """Parse a Kalshi ISO-8601 close time (memoized, markets repeat every sweep)"""
+    return datetime.fromisoformat(close_time.replace("Z", "+00:00"))
+
+
 class ExitCondition:
     """Represents a condition for exiting a position"""
 
@@ -34,6 +44,12 @@ class PositionManager:
     - Manual: User-initiated close
     """
 
+    # Max Kalshi requests in flight while positions are checked concurrently
+    MAX_CONCURRENT_API_CALLS = 8
+
+    # P&L direction per contract side: yes profits as price rises, no as it falls
+    SIDE_SIGNS = {"yes": 1, "no": -1}
+
     def __init__(
         self,
         kalshi_client: KalshiClient,
@@ -51,6 +67,12 @@ class PositionManager:
         self.stop_loss_pct = config.get("stop_loss_percentage", 0.30)
         self.time_before_close_hours = config.get("position_timeout_hours", 24)
 
+        # Profit target step (2x an expected 5% edge) and stop-loss floor
+        self._profit_step = self.profit_target_multiplier * 0.05
+        self._neg_stop_loss = -self.stop_loss_pct
+
+        self._api_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_API_CALLS)
+
         logger.info("Position manager initialized")
 
     async def monitor_positions(self):
@@ -64,28 +86,49 @@ class PositionManager:
 
         logger.info(f"Monitoring {len(open_trades)} open positions")
 
-        # Get current positions from Kalshi
+        # Get current positions and markets from Kalshi
         kalshi_positions = self.kalshi.get_positions()
         position_map = {p.ticker: p for p in kalshi_positions}
+        market_map = self._fetch_markets(open_trades)
+
+        results = await asyncio.gather(
+            *(
+                self._check_position(
+                    trade, position_map.get(trade.ticker), market_map.get(trade.ticker)
+                )
+                for trade in open_trades
+            ),
+            return_exceptions=True,
+        )
 
-        for trade in open_trades:
-            try:
-                await self._check_position(trade, position_map.get(trade.ticker))
-            except Exception as e:
-                logger.error(f"Error checking position {trade.ticker}: {e}")
+        for trade, result in zip(open_trades, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error checking position {trade.ticker}: {result}")
+
+    async def _call_api(self, func, *args, **kwargs):
+        """Await an async KalshiClient call, bounded by the semaphore"""
+        async with self._api_semaphore:
+            return await func(*args, **kwargs)
+
+    def _fetch_markets(self, trades: List[Trade]) -> Dict[str, Market]:
+        """Fetch markets for all trades in one batched call"""
+        return self.kalshi.get_markets_by_ticker([t.ticker for t in trades])
 
-    async def _check_position(self, trade: Trade, kalshi_position):
+    async def _check_position(
+        self, trade: Trade, kalshi_position, market: Optional[Market] = None
+    ):
         """Check if a position should be closed"""
-        # Get market info
-        market = self.kalshi.get_market(trade.ticker)
+        # Get market info (single fetch only if the batch missed it)
+        if market is None:
+            market = await self._call_api(self.kalshi.aget_market, trade.ticker)
 
         if not market:
-            logger.warning(f"Market not found: {trade.ticker}")
+            logger.warning("Market not found: %s", trade.ticker)
             return
 
         # Check if market is closed
         if market.status in ["closed", "settled"]:
-            logger.info(f"Market {trade.ticker} is {market.status}")
+            logger.info("Market %s is %s", trade.ticker, market.status)
             await self._close_position(trade, market.last_price, ExitCondition.MARKET_CLOSED)
             return
 
@@ -93,7 +136,7 @@ class PositionManager:
         current_price = market.last_price or market.yes_bid
 
         if not current_price:
-            logger.warning(f"No price data for {trade.ticker}")
+            logger.warning("No price data for %s", trade.ticker)
             return
 
         # Calculate P&L
@@ -101,45 +144,44 @@ class PositionManager:
         quantity = trade.quantity
 
         # P&L in cents per contract
-        if trade.side == "yes":
-            pnl_per_contract = current_price - entry_price
-        else:
-            pnl_per_contract = entry_price - current_price
+        side_sign = self.SIDE_SIGNS.get(trade.side, -1)
+        pnl_per_contract = side_sign * (current_price - entry_price)
 
         total_pnl = pnl_per_contract * quantity
         pnl_pct = pnl_per_contract / entry_price if entry_price > 0 else 0
 
-        logger.debug(
-            f"{trade.ticker}: Entry=${entry_price:.2f}, Current=${current_price:.2f}, "
-            f"P&L=${total_pnl:.2f} ({pnl_pct:.1%})"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "%s: Entry=$%.2f, Current=$%.2f, P&L=$%.2f (%.1f%%)",
+                trade.ticker,
+                entry_price,
+                current_price,
+                total_pnl,
+                pnl_pct * 100,
+            )
 
         # Check profit target
         # If we entered expecting 5% edge, take profit at 10% (2x)
-        profit_target = (
-            entry_price * (1 + self.profit_target_multiplier * 0.05)
-            if trade.side == "yes"
-            else entry_price * (1 - self.profit_target_multiplier * 0.05)
-        )
-
-        if trade.side == "yes" and current_price >= profit_target:
-            logger.info(
-                f"Profit target hit for {trade.ticker}: {current_price:.2f} >= {profit_target:.2f}"
-            )
-            await self._close_position(trade, current_price, ExitCondition.PROFIT_TARGET)
-            return
+        profit_target = entry_price * (1 + side_sign * self._profit_step)
 
-        if trade.side == "no" and current_price <= profit_target:
+        if side_sign * current_price >= side_sign * profit_target:
             logger.info(
-                f"Profit target hit for {trade.ticker}: {current_price:.2f} <= {profit_target:.2f}"
+                "Profit target hit for %s: %.2f %s %.2f",
+                trade.ticker,
+                current_price,
+                ">=" if side_sign > 0 else "<=",
+                profit_target,
             )
             await self._close_position(trade, current_price, ExitCondition.PROFIT_TARGET)
             return
 
         # Check stop loss
-        if pnl_pct < -self.stop_loss_pct:
+        if pnl_pct < self._neg_stop_loss:
             logger.warning(
-                f"Stop loss hit for {trade.ticker}: {pnl_pct:.1%} < -{self.stop_loss_pct:.1%}"
+                "Stop loss hit for %s: %.1f%% < -%.1f%%",
+                trade.ticker,
+                pnl_pct * 100,
+                self.stop_loss_pct * 100,
             )
             await self._close_position(trade, current_price, ExitCondition.STOP_LOSS)
             return
@@ -148,9 +190,7 @@ class PositionManager:
         if market.close_time:
             try:
                 if isinstance(market.close_time, str):
-                    close_time = datetime.fromisoformat(
-                        market.close_time.replace("Z", "+00:00")
-                    )
+                    close_time = _parse_close_time(market.close_time)
                 else:
                     close_time = market.close_time
 
@@ -158,25 +198,44 @@ class PositionManager:
 
                 if hours_until_close < self.time_before_close_hours:
                     logger.info(
-                        f"Time decay exit for {trade.ticker}: {hours_until_close:.1f}h until close"
+                        "Time decay exit for %s: %.1fh until close",
+                        trade.ticker,
+                        hours_until_close,
                     )
                     await self._close_position(trade, current_price, ExitCondition.TIME_DECAY)
                     return
             except Exception as e:
-                logger.error(f"Error parsing close time: {e}")
+                logger.error("Error parsing close time: %s", e)
 
     async def _close_position(
-        self, trade: Trade, current_price: float, reason: str
-    ):
-        """Close a position"""
+        self, trade: Trade, current_price: float, reason: str, alert: bool = True
+    ) -> Optional[float]:
+        """
+        Close a position.
+
+        Args:
+            trade: Open trade to close
+            current_price: Exit price in dollars
+            reason: ExitCondition describing why the position is closed
+            alert: Send a per-position alert (disabled for bulk closes)
+
+        Returns:
+            Net P&L of the closed position, or None if it could not be closed
+        """
         try:
-            logger.info(f"Closing position: {trade.ticker} at ${current_price:.2f}, reason: {reason}")
+            logger.info(
+                "Closing position: %s at $%.2f, reason: %s",
+                trade.ticker,
+                current_price,
+                reason,
+            )
 
             # Place opposite order to close
             opposite_side = "no" if trade.side == "yes" else "yes"
             price_cents = int(current_price * 100)
 
-            order = self.kalshi.place_order(
+            order = await self._call_api(
+                self.kalshi.aplace_order,
                 ticker=trade.ticker,
                 side=opposite_side,
                 quantity=trade.quantity,
@@ -185,17 +244,16 @@ class PositionManager:
             )
 
             if not order:
-                logger.error(f"Failed to close position {trade.ticker}")
-                return
+                logger.error("Failed to close position %s", trade.ticker)
+                return None
 
             # Calculate P&L
             entry_price = trade.entry_price
             exit_price = current_price
 
-            if trade.side == "yes":
-                pnl_per_contract = exit_price - entry_price
-            else:
-                pnl_per_contract = entry_price - exit_price
+            pnl_per_contract = self.SIDE_SIGNS.get(trade.side, -1) * (
+                exit_price - entry_price
+            )
 
             total_pnl = pnl_per_contract * trade.quantity
 
@@ -212,82 +270,157 @@ class PositionManager:
             trade.close_reason = reason
             trade.closed_at = datetime.utcnow()
 
-            self.db.commit()
+            # The closing order is live, so persist this close on its own; a
+            # failed batch commit would reopen it and the next sweep would
+            # send a second closing order
+            self._commit()
 
             # Send alert
-            pnl_emoji = "✅" if net_pnl > 0 else "❌"
-            await self._send_alert(
-                f"{pnl_emoji} Position closed: {trade.ticker}\n"
-                f"Entry: ${entry_price:.2f}, Exit: ${exit_price:.2f}\n"
-                f"P&L: ${net_pnl:.2f} ({pnl_per_contract/entry_price:.1%})\n"
-                f"Reason: {reason}"
-            )
+            if alert:
+                pnl_emoji = "✅" if net_pnl > 0 else "❌"
+                await self._send_alert(
+                    f"{pnl_emoji} Position closed: {trade.ticker}\n"
+                    f"Entry: ${entry_price:.2f}, Exit: ${exit_price:.2f}\n"
+                    f"P&L: ${net_pnl:.2f} ({pnl_per_contract/entry_price:.1%})\n"
+                    f"Reason: {reason}"
+                )
 
             logger.info(
-                f"Position closed: {trade.ticker}, P&L=${net_pnl:.2f}, reason={reason}"
+                "Position closed: %s, P&L=$%.2f, reason=%s", trade.ticker, net_pnl, reason
             )
+            return net_pnl
 
         except Exception as e:
-            logger.error(f"Error closing position {trade.ticker}: {e}")
-            await self._send_alert(f"❌ Error closing position {trade.ticker}: {e}")
+            logger.error("Error closing position %s: %s", trade.ticker, e)
+            if alert:
+                await self._send_alert(f"❌ Error closing position {trade.ticker}: {e}")
+            return None
 
     async def close_all_positions(self, reason: str = "manual"):
         """Emergency close all positions"""
         logger.warning(f"Closing all positions: {reason}")
 
         open_trades = self.db.query(Trade).filter(Trade.status == "open").all()
+        market_map = self._fetch_markets(open_trades)
+
+        # Close everything concurrently; one alert for the sweep
+        results = await asyncio.gather(
+            *(
+                self._close_at_market(trade, market_map.get(trade.ticker), reason)
+                for trade in open_trades
+            ),
+            return_exceptions=True,
+        )
 
-        for trade in open_trades:
-            market = self.kalshi.get_market(trade.ticker)
-            if market:
-                current_price = market.last_price or market.yes_bid or trade.entry_price
-                await self._close_position(trade, current_price, reason)
+        closed_pnls = [
+            r for r in results if r is not None and not isinstance(r, Exception)
+        ]
+        failed = len(open_trades) - len(closed_pnls)
+        summary = (
+            f"🔴 All positions closed. Reason: {reason}\n"
+            f"Closed: {len(closed_pnls)}/{len(open_trades)}, "
+            f"P&L: ${sum(closed_pnls):.2f}"
+        )
+        if failed:
+            summary += f"\n❌ Failed to close: {failed}"
 
-        await self._send_alert(f"🔴 All positions closed. Reason: {reason}")
+        await self._send_alert(summary)
 
-    def get_position_summary(self) -> Dict:
-        """Get summary of all open positions"""
-        open_trades = self.db.query(Trade).filter(Trade.status == "open").all()
+    async def _close_at_market(
+        self, trade: Trade, market: Optional[Market], reason: str
+    ) -> Optional[float]:
+        """Close a trade at its current market price without a per-trade alert"""
+        if market is None:
+            market = await self._call_api(self.kalshi.aget_market, trade.ticker)
+
+        if not market:
+            logger.warning("Market not found: %s", trade.ticker)
+            return None
+
+        current_price = market.last_price or market.yes_bid or trade.entry_price
+        return await self._close_position(trade, current_price, reason, alert=False)
+
+    def get_position_summary(self, summary_only: bool = False) -> Dict:
+        """
+        Get summary of all open positions.
+
+        Args:
+            summary_only: Skip building the per-position details list
+
+        Returns:
+            Dict with total_positions, total_unrealized_pnl and positions
+        """
+        # Read-only, so load just the columns used instead of full Trade objects
+        open_trades = (
+            self.db.query(Trade.ticker, Trade.side, Trade.quantity, Trade.entry_price)
+            .filter(Trade.status == "open")
+            .all()
+        )
 
         total_positions = len(open_trades)
-        total_unrealized_pnl = 0
-        position_details = []
+        market_map = self._fetch_markets(open_trades)
 
+        priced_trades = []
+        current_prices = []
         for trade in open_trades:
-            market = self.kalshi.get_market(trade.ticker)
+            market = market_map.get(trade.ticker) or self.kalshi.get_market(trade.ticker)
             if not market:
                 continue
 
-            current_price = market.last_price or market.yes_bid or trade.entry_price
+            priced_trades.append(trade)
+            current_prices.append(
+                market.last_price or market.yes_bid or trade.entry_price
+            )
 
-            if trade.side == "yes":
-                pnl_per_contract = current_price - trade.entry_price
-            else:
-                pnl_per_contract = trade.entry_price - current_price
+        n = len(priced_trades)
+        entry = np.fromiter((t.entry_price for t in priced_trades), float, n)
+        quantity = np.fromiter((t.quantity for t in priced_trades), float, n)
+        sign = np.fromiter(
+            (self.SIDE_SIGNS.get(t.side, -1) for t in priced_trades), float, n
+        )
+        current = np.asarray(current_prices, dtype=float)
 
-            total_pnl = pnl_per_contract * trade.quantity
-            total_unrealized_pnl += total_pnl
-
-            position_details.append(
-                {
-                    "ticker": trade.ticker,
-                    "side": trade.side,
-                    "quantity": trade.quantity,
-                    "entry_price": trade.entry_price,
-                    "current_price": current_price,
-                    "unrealized_pnl": total_pnl,
-                    "pnl_pct": pnl_per_contract / trade.entry_price
-                    if trade.entry_price > 0
-                    else 0,
-                }
-            )
+        pnl_per_contract = sign * (current - entry)
+        unrealized_pnl = pnl_per_contract * quantity
 
-        return {
+        summary = {
             "total_positions": total_positions,
-            "total_unrealized_pnl": total_unrealized_pnl,
-            "positions": position_details,
+            "total_unrealized_pnl": float(unrealized_pnl.sum()),
+            "positions": [],
         }
 
+        if summary_only:
+            return summary
+
+        pnl_pct = np.divide(
+            pnl_per_contract, entry, out=np.zeros(n), where=entry > 0
+        )
+
+        summary["positions"] = [
+            {
+                "ticker": trade.ticker,
+                "side": trade.side,
+                "quantity": trade.quantity,
+                "entry_price": trade.entry_price,
+                "current_price": price,
+                "unrealized_pnl": pnl,
+                "pnl_pct": pct,
+            }
+            for trade, price, pnl, pct in zip(
+                priced_trades, current_prices, unrealized_pnl.tolist(), pnl_pct.tolist()
+            )
+        ]
+
+        return summary
+
+    def _commit(self):
+        """Commit pending writes, rolling back on failure"""
+        try:
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
     async def _send_alert(self, message: str):
         """Send alert via callback"""
         if self.alert_callback:
@@ -4,12 +4,15 @@ Receives signals and executes trades with proper risk management and validation.
 """
 
 import asyncio
-import hashlib
 import logging
+import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List
+from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
 
+from cachetools import LRUCache
+
 from src.edge_detection.speed_arbitrage import TradeSignal
 from src.api.kalshi_client import KalshiClient, Order
 from src.database.models import Trade, Signal as DBSignal, Position as DBPosition
@@ -53,27 +56,23 @@ class PositionSizer:
         Returns:
             Position size in dollars
         """
-        # Kelly formula: f* = (bp - q) / b
+        # Kelly formula: f* = (bp - q) / b = p - q / b
         # where b = odds, p = win probability, q = loss probability
 
-        # Simplified: use edge and confidence
-        win_prob = confidence
-        loss_prob = 1 - win_prob
-
         # Odds are roughly edge / (1 - edge)
         if edge <= 0 or edge >= 1:
             return 0
 
-        b = edge / (1 - edge)
-
-        # Kelly percentage
-        kelly_pct = (b * win_prob - loss_prob) / b
-
-        # Apply fraction for safety
-        kelly_pct *= kelly_fraction
-
-        # Clamp to reasonable range
-        kelly_pct = max(0, min(kelly_pct, 0.25))  # Never more than 25% of bankroll
+        # Simplified: use edge and confidence as win probability, so
+        # f* = p - (1 - p) * (1 - edge) / edge, scaled by the Kelly fraction
+        # and clamped to [0, 25%] of bankroll
+        kelly_pct = min(
+            0.25,
+            max(
+                0.0,
+                kelly_fraction * (confidence - (1 - confidence) * (1 - edge) / edge),
+            ),
+        )
 
         position_size = bankroll * kelly_pct
         return position_size
@@ -102,6 +101,14 @@ class PositionSizer:
         max_heat = config.get("max_portfolio_heat", 0.20)
         kelly_fraction = config.get("kelly_fraction", 0.25)
 
+        # Check portfolio heat limit first so a full book skips the Kelly math
+        max_exposure = current_balance * max_heat
+        remaining_capacity = max_exposure - current_exposure
+
+        if remaining_capacity <= 0:
+            logger.warning("Portfolio heat limit reached")
+            return 0
+
         # Calculate Kelly size
         kelly_size = PositionSizer.kelly_position_size(
             edge=signal.edge_percentage,
@@ -113,14 +120,6 @@ class PositionSizer:
         # Apply position limit
         position_size_usd = min(kelly_size, max_position)
 
-        # Check portfolio heat limit
-        max_exposure = current_balance * max_heat
-        remaining_capacity = max_exposure - current_exposure
-
-        if remaining_capacity <= 0:
-            logger.warning("Portfolio heat limit reached")
-            return 0
-
         position_size_usd = min(position_size_usd, remaining_capacity)
 
         # Convert to number of contracts
@@ -132,8 +131,11 @@ class PositionSizer:
         num_contracts = max(1, num_contracts)
 
         logger.info(
-            f"Position sizing: Kelly=${kelly_size:.2f}, Final=${position_size_usd:.2f}, "
-            f"Contracts={num_contracts} @ {price_cents}¢"
+            "Position sizing: Kelly=$%.2f, Final=$%.2f, Contracts=%d @ %d¢",
+            kelly_size,
+            position_size_usd,
+            num_contracts,
+            price_cents,
         )
 
         return num_contracts
@@ -144,7 +146,7 @@ class OrderValidator:
 
     @staticmethod
     def validate_signal(
-        signal: TradeSignal, config: Dict, seen_signals: set
+        signal: TradeSignal, config: Dict, seen_signals: LRUCache
     ) -> tuple[bool, Optional[str]]:
         """
         Validate a trade signal.
@@ -152,9 +154,8 @@ class OrderValidator:
         Returns:
             (is_valid, rejection_reason)
         """
-        # Check if already executed
-        signal_hash = hashlib.md5(signal.signal_id.encode()).hexdigest()
-        if signal_hash in seen_signals:
+        # Check if already executed (signal_id is unique, no need to hash it)
+        if signal.signal_id in seen_signals:
             return False, "Duplicate signal"
 
         # Check confidence threshold
@@ -265,8 +266,22 @@ class TradeExecutor:
     - Execute orders via Kalshi API
     - Monitor fills
     - Manage risk limits
+
+    Concurrency: execute_signal may be awaited from several asyncio tasks on
+    one event loop. A signal is claimed in _pending_signals before its first
+    await so the same signal_id cannot be executed twice concurrently, and
+    _order_lock is held from the risk checks until the placed order is
+    recorded in recent_trades and the running exposure, so concurrent signals
+    cannot all pass the same limits. Alerts are sent after the lock is
+    released. The executor is not safe to share across threads.
     """
 
+    # Executed signal ids remembered for duplicate detection
+    MAX_SEEN_SIGNALS = 10000
+
+    # How often the running exposure total is reconciled against Kalshi positions
+    EXPOSURE_RECONCILE_SECONDS = 60
+
     def __init__(
         self,
         kalshi_client: KalshiClient,
@@ -294,11 +309,27 @@ class TradeExecutor:
         )
 
         # State tracking
-        self.seen_signals: set = set()
-        self.recent_trades: List[datetime] = []
-        self.last_loss_time: Optional[datetime] = None
+        self.seen_signals: LRUCache = LRUCache(maxsize=self.MAX_SEEN_SIGNALS)
+        self._pending_signals: set = set()
+        # Held from the risk checks until the order's state updates land, so
+        # concurrent signals cannot all pass the same rate and exposure checks
+        self._order_lock = asyncio.Lock()
+
+        # Running exposure in USD, reconciled against Kalshi periodically
+        self._current_exposure: float = 0.0
+        self._exposure_synced_at: Optional[float] = None
+        # Ring of the last max_trades_per_hour trade times (time.monotonic(),
+        # immune to wall-clock jumps); older entries fall off automatically
+        self.recent_trades: deque = deque(
+            maxlen=max(0, self.risk_limits.max_trades_per_hour)
+        )
+        self.last_loss_time: Optional[float] = None
         self.daily_pnl: float = 0
 
+        # Today's trade count, loaded from the DB once per day then kept in memory
+        self._daily_trade_count: int = 0
+        self._next_day_start_ts: float = 0.0  # epoch seconds of next local midnight
+
         # Circuit breaker
         self.circuit_breaker = CircuitBreaker(config)
 
@@ -336,33 +367,61 @@ class TradeExecutor:
 
         if not is_valid:
             logger.info(f"Signal rejected: {rejection_reason}")
-            self._record_rejected_signal(signal, rejection_reason)
+            self._record_rejected_signal(self._get_db_signal(signal), rejection_reason)
+            self._commit()
             return None
 
+        # Claim the signal before the first await so a concurrent task carrying
+        # the same signal_id cannot pass validation while this order is in flight
+        if signal.signal_id in self._pending_signals:
+            logger.info(f"Signal {signal.signal_id} already being executed - skipped")
+            return None
+
+        self._pending_signals.add(signal.signal_id)
+        try:
+            async with self._order_lock:
+                trade, alert = await self._execute_validated_signal(signal)
+        finally:
+            self._pending_signals.discard(signal.signal_id)
+
+        # Alert outside the lock so a Telegram round-trip does not delay the
+        # next signal's risk checks and order
+        if alert:
+            await self._send_alert(alert)
+
+        return trade
+
+    async def _execute_validated_signal(
+        self, signal: TradeSignal
+    ) -> Tuple[Optional[Trade], Optional[str]]:
+        """
+        Apply risk limits, size and place the order for a validated signal.
+
+        Returns:
+            (trade, alert) where trade is None if nothing was executed and
+            alert is the message to send once the order lock is released
+        """
         # Check rate limits
         if not self._check_rate_limits():
             logger.warning("Rate limit exceeded - signal not executed")
-            return None
+            return None, None
 
         # Check daily loss limit
         if self.daily_pnl < -self.risk_limits.max_daily_loss:
             logger.critical(
                 f"Daily loss limit reached: ${self.daily_pnl:.2f}. Trading paused."
             )
-            await self._send_alert(
-                f"🔴 Daily loss limit reached: ${self.daily_pnl:.2f}"
-            )
-            return None
+            return None, f"🔴 Daily loss limit reached: ${self.daily_pnl:.2f}"
 
         # Check cooldown after loss
         if self.last_loss_time:
-            seconds_since_loss = (datetime.now() - self.last_loss_time).total_seconds()
+            seconds_since_loss = time.monotonic() - self.last_loss_time
             if seconds_since_loss < self.risk_limits.cooldown_after_loss_seconds:
                 logger.info(
                     f"In cooldown period ({seconds_since_loss:.0f}s / "
                     f"{self.risk_limits.cooldown_after_loss_seconds}s)"
                 )
-                return None
+                return None, None
 
         # Get current balance and exposure
         balance_info = self.kalshi.get_balance()
@@ -376,7 +435,7 @@ class TradeExecutor:
 
         if quantity == 0:
             logger.info("Position size calculated as 0 - signal not executed")
-            return None
+            return None, None
 
         # Calculate limit price (start at current price, adjust based on urgency)
         limit_price = int(signal.current_price * 100) if signal.current_price else 50
@@ -388,7 +447,7 @@ class TradeExecutor:
 
         if not is_valid:
             logger.error(f"Order validation failed: {rejection_reason}")
-            return None
+            return None, None
 
         # Place order
         try:
@@ -396,7 +455,7 @@ class TradeExecutor:
                 f"Placing order: {quantity} {signal.side} @ {limit_price}¢ on {signal.ticker}"
             )
 
-            order = self.kalshi.place_order(
+            order = await self.kalshi.aplace_order(
                 ticker=signal.ticker,
                 side=signal.side,
                 quantity=quantity,
@@ -406,56 +465,57 @@ class TradeExecutor:
 
             if not order:
                 logger.error("Order placement failed")
-                return None
+                return None, None
+
+            # The order is live now, so count its cost before any DB work
+            self._current_exposure += quantity * limit_price / 100
 
-            # Record trade
-            trade = self._record_trade(signal, order, quantity, limit_price)
+            # Record trade and mark signal as executed in one transaction
+            db_signal = self._get_db_signal(signal)
+            trade = self._record_trade(signal, db_signal, order, quantity, limit_price)
+            self._mark_signal_executed(db_signal)
+            self._commit()
 
-            # Mark signal as executed
-            signal_hash = hashlib.md5(signal.signal_id.encode()).hexdigest()
-            self.seen_signals.add(signal_hash)
-            self._mark_signal_executed(signal)
+            self.seen_signals[signal.signal_id] = True
 
             # Track for rate limiting
-            self.recent_trades.append(datetime.now())
+            self.recent_trades.append(time.monotonic())
 
-            # Send alert
-            await self._send_alert(
+            logger.info(f"Trade executed successfully: {order}")
+            return trade, (
                 f"✅ Trade executed: {quantity} {signal.side} {signal.ticker} @ {limit_price}¢\n"
                 f"Edge: {signal.edge_percentage:.1%}, Confidence: {signal.confidence:.2f}\n"
                 f"Reason: {signal.reasoning[:100]}"
             )
 
-            logger.info(f"Trade executed successfully: {order}")
-            return trade
-
         except Exception as e:
             logger.error(f"Error executing trade: {e}")
-            await self._send_alert(f"❌ Trade execution failed: {e}")
-            return None
+            return None, f"❌ Trade execution failed: {e}"
 
     def _check_rate_limits(self) -> bool:
         """Check if we're within rate limits"""
-        now = datetime.now()
-
-        # Clean old trades
-        hour_ago = now - timedelta(hours=1)
-        self.recent_trades = [t for t in self.recent_trades if t > hour_ago]
+        # Check hourly limit: it is reached when the ring is full and its
+        # oldest entry is still inside the last hour
+        recent_trades = self.recent_trades
+        if len(recent_trades) == recent_trades.maxlen and (
+            not recent_trades or recent_trades[0] > time.monotonic() - 3600
+        ):
+            logger.warning(f"Hourly trade limit reached: {len(recent_trades)} trades")
+            return False
 
-        # Check hourly limit
-        if len(self.recent_trades) >= self.risk_limits.max_trades_per_hour:
-            logger.warning(
-                f"Hourly trade limit reached: {len(self.recent_trades)} trades"
+        # Check daily limit (reload from DB only when the day rolls over; the
+        # common path is a single float comparison)
+        if time.time() >= self._next_day_start_ts:
+            today_start = datetime.combine(datetime.now().date(), datetime.min.time())
+            self._daily_trade_count = (
+                self.db.query(Trade)
+                .filter(Trade.executed_at >= today_start)
+                .count()
             )
-            return False
+            self._next_day_start_ts = (today_start + timedelta(days=1)).timestamp()
+            self.daily_pnl = 0
 
-        # Check daily limit (would need to query DB for accuracy)
-        today_start = datetime.combine(now.date(), datetime.min.time())
-        daily_trades = (
-            self.db.query(Trade)
-            .filter(Trade.executed_at >= today_start)
-            .count()
-        )
+        daily_trades = self._daily_trade_count
 
         if daily_trades >= self.risk_limits.max_trades_per_day:
             logger.warning(f"Daily trade limit reached: {daily_trades} trades")
@@ -464,24 +524,45 @@ class TradeExecutor:
         return True
 
     def _calculate_current_exposure(self) -> float:
-        """Calculate total current position exposure"""
-        positions = self.kalshi.get_positions()
-        total_exposure = sum(
-            abs(p.total_cost) / 100 for p in positions  # Convert cents to dollars
-        )
-        return total_exposure
+        """
+        Get total current position exposure.
 
-    def _record_trade(
-        self, signal: TradeSignal, order: Order, quantity: int, price: int
-    ) -> Trade:
-        """Record trade in database"""
-        # Find signal in DB
-        db_signal = (
+        Orders placed here are added to a running total as they execute; the
+        total is rebuilt from Kalshi positions at most every
+        EXPOSURE_RECONCILE_SECONDS to pick up closes and fills made elsewhere.
+        Between reconciles, closed positions still count, which errs on the
+        side of less new risk.
+        """
+        now = time.monotonic()
+        if (
+            self._exposure_synced_at is None
+            or now - self._exposure_synced_at >= self.EXPOSURE_RECONCILE_SECONDS
+        ):
+            positions = self.kalshi.get_positions()
+            self._current_exposure = sum(
+                abs(p.total_cost) / 100 for p in positions  # Convert cents to dollars
+            )
+            self._exposure_synced_at = now
+
+        return self._current_exposure
+
+    def _get_db_signal(self, signal: TradeSignal) -> Optional[DBSignal]:
+        """Find the stored row for a signal (looked up once per execution)"""
+        return (
             self.db.query(DBSignal)
             .filter(DBSignal.signal_id == signal.signal_id)
             .first()
         )
 
+    def _record_trade(
+        self,
+        signal: TradeSignal,
+        db_signal: Optional[DBSignal],
+        order: Order,
+        quantity: int,
+        price: int,
+    ) -> Trade:
+        """Record trade in database"""
         trade = Trade(
             signal_id=db_signal.id if db_signal else None,
             order_id=order.order_id,
@@ -494,35 +575,29 @@ class TradeExecutor:
         )
 
         self.db.add(trade)
-        self.db.commit()
+        self._daily_trade_count += 1
 
         return trade
 
-    def _mark_signal_executed(self, signal: TradeSignal):
+    def _mark_signal_executed(self, db_signal: Optional[DBSignal]):
         """Mark signal as executed in database"""
-        db_signal = (
-            self.db.query(DBSignal)
-            .filter(DBSignal.signal_id == signal.signal_id)
-            .first()
-        )
-
         if db_signal:
             db_signal.executed = True
             db_signal.executed_at = datetime.utcnow()
-            self.db.commit()
 
-    def _record_rejected_signal(self, signal: TradeSignal, reason: str):
+    def _record_rejected_signal(self, db_signal: Optional[DBSignal], reason: str):
         """Record rejected signal in database"""
-        db_signal = (
-            self.db.query(DBSignal)
-            .filter(DBSignal.signal_id == signal.signal_id)
-            .first()
-        )
-
         if db_signal:
             db_signal.rejected = True
             db_signal.rejection_reason = reason
+
+    def _commit(self):
+        """Commit pending writes as one transaction, rolling back on failure"""
+        try:
             self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
 
     async def _send_alert(self, message: str):
         """Send alert via callback"""
@@ -3,10 +3,18 @@ Prometheus metrics collection for the trading system.
 """
 
 import logging
+from functools import lru_cache
+
 from prometheus_client import Counter, Histogram, Gauge, start_http_server
 
 logger = logging.getLogger(__name__)
 
+# Set once the exporter is serving; until then record_* calls are no-ops
+_metrics_enabled = False
+
+# "executed" label values indexed by the bool flag
+_EXECUTED_LABELS = ("no", "yes")
+
 
 # Trade metrics
 trades_total = Counter(
@@ -18,7 +26,7 @@ trades_total = Counter(
 trade_pnl = Histogram(
     "kalshi_trade_pnl_dollars",
     "Trade P&L in dollars",
-    buckets=[-500, -200, -100, -50, -20, 0, 20, 50, 100, 200, 500, 1000],
+    buckets=(-500, -200, -100, -50, -20, 0, 20, 50, 100, 200, 500, 1000),
 )
 
 # Signal metrics
@@ -31,7 +39,8 @@ signals_total = Counter(
 signal_latency_seconds = Histogram(
     "kalshi_signal_latency_seconds",
     "Time from news event to signal generation",
-    buckets=[0.1, 0.5, 1, 2, 5, 10, 30, 60],
+    # Doubling buckets from 100ms to ~51s, evenly spread around the 1s target
+    buckets=tuple(0.1 * 2**i for i in range(10)),
 )
 
 # Position metrics
@@ -55,7 +64,7 @@ api_request_duration_seconds = Histogram(
     "kalshi_api_request_duration_seconds",
     "Kalshi API request duration",
     ["endpoint", "method"],
-    buckets=[0.1, 0.25, 0.5, 1, 2.5, 5, 10],
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 10),
 )
 
 api_errors_total = Counter(
@@ -84,32 +93,43 @@ circuit_breaker_trips = Counter(
 )
 
 
+@lru_cache(maxsize=4096)
+def _child(metric, *label_values):
+    """Get a labelled child of a metric, cached to skip labels() lookup and locking"""
+    return metric.labels(*label_values)
+
+
 class MetricsCollector:
     """Centralized metrics collection"""
 
     @staticmethod
     def record_trade(side: str, ticker: str, status: str, pnl: float = None):
         """Record a trade execution"""
-        trades_total.labels(side=side, ticker=ticker, status=status).inc()
+        if not _metrics_enabled:
+            return
+        _child(trades_total, side, ticker, status).inc()
         if pnl is not None:
             trade_pnl.observe(pnl)
 
     @staticmethod
     def record_signal(source: str, executed: bool):
         """Record a signal generation"""
-        signals_total.labels(
-            source=source,
-            executed="yes" if executed else "no"
-        ).inc()
+        if not _metrics_enabled:
+            return
+        _child(signals_total, source, _EXECUTED_LABELS[executed]).inc()
 
     @staticmethod
     def record_signal_latency(seconds: float):
         """Record time from news to signal"""
+        if not _metrics_enabled:
+            return
         signal_latency_seconds.observe(seconds)
 
     @staticmethod
     def update_positions(num_positions: int, total_value: float, total_unrealized_pnl: float):
         """Update position metrics"""
+        if not _metrics_enabled:
+            return
         open_positions.set(num_positions)
         portfolio_value.set(total_value)
         unrealized_pnl.set(total_unrealized_pnl)
@@ -117,45 +137,45 @@ class MetricsCollector:
     @staticmethod
     def record_api_request(endpoint: str, method: str, duration: float):
         """Record API request duration"""
-        api_request_duration_seconds.labels(
-            endpoint=endpoint,
-            method=method
-        ).observe(duration)
+        if not _metrics_enabled:
+            return
+        _child(api_request_duration_seconds, endpoint, method).observe(duration)
 
     @staticmethod
     def record_api_error(endpoint: str, error_type: str):
         """Record API error"""
-        api_errors_total.labels(
-            endpoint=endpoint,
-            error_type=error_type
-        ).inc()
+        if not _metrics_enabled:
+            return
+        _child(api_errors_total, endpoint, error_type).inc()
 
     @staticmethod
     def record_news_event(source: str, event_type: str):
         """Record news event detection"""
-        news_events_total.labels(
-            source=source,
-            event_type=event_type
-        ).inc()
+        if not _metrics_enabled:
+            return
+        _child(news_events_total, source, event_type).inc()
 
     @staticmethod
     def record_system_error(component: str, error_type: str):
         """Record system error"""
-        system_errors_total.labels(
-            component=component,
-            error_type=error_type
-        ).inc()
+        if not _metrics_enabled:
+            return
+        _child(system_errors_total, component, error_type).inc()
 
     @staticmethod
     def record_circuit_breaker_trip():
         """Record circuit breaker trip"""
+        if not _metrics_enabled:
+            return
         circuit_breaker_trips.inc()
 
 
 def start_metrics_server(port: int = 9090):
     """Start Prometheus metrics HTTP server"""
+    global _metrics_enabled
     try:
         start_http_server(port)
+        _metrics_enabled = True
         logger.info(f"Metrics server started on port {port}")
     except Exception as e:
         logger.error(f"Failed to start metrics server: {e}")
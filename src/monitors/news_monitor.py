@@ -4,16 +4,18 @@ Aggregates news from Twitter, NewsAPI, Alpha Vantage, and other sources.
 """
 
 import asyncio
-import hashlib
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Set, Any
+import time
+from datetime import datetime
+from typing import List, Dict, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from itertools import islice
 import re
 
 import httpx
-from cachetools import TTLCache
+import xxhash
+from cachetools import LRUCache, TTLCache
 
 # Optional imports - only needed if you use Twitter/NewsAPI
 try:
@@ -26,8 +28,37 @@ try:
 except ImportError:
     NewsApiClient = None
 
+# Optional - single-pass keyword matching; falls back to per-keyword scans
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional faster JSON decoding for Alpha Vantage / NOAA payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Bounds for per-source "already seen" ids: long enough to outlive how long an
+# article or alert stays listed upstream, capped so memory stays flat
+SEEN_IDS_MAXSIZE = 20000
+SEEN_IDS_TTL_SECONDS = 7 * 86400
+
+# Tweets older than the 5 minute lookback are skipped anyway, so a fixed
+# number of the most recent ids is enough to dedup them
+SEEN_TWEETS_MAXSIZE = 50000
+
+# Shared HTTP client settings for the polling monitors
+HTTP_TIMEOUT_SECONDS = 10.0
+HTTP_MAX_KEEPALIVE = 8
+
+# Numbers (potential data points) and capitalized phrases (entity candidates)
+_NUMBER_RE = re.compile(r"\b\d+\.?\d*%?\b")
+_ENTITY_RE = re.compile(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b")
+
 
 class EventType(Enum):
     """Types of market-moving events"""
@@ -40,9 +71,9 @@ class EventType(Enum):
     GENERAL = "general"
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsEvent:
-    """Structured news event with metadata"""
+    """Structured news event with metadata (slotted: no per-instance __dict__)"""
 
     event_id: str
     timestamp: datetime
@@ -64,8 +95,9 @@ class NewsEvent:
 class NewsClassifier:
     """Classifies news into event types and extracts relevant information"""
 
-    # Keyword mappings for event classification
-    ECONOMIC_KEYWORDS = {
+    # Keyword mappings for event classification (frozen: the matchers below
+    # are built from them once at import)
+    ECONOMIC_KEYWORDS = frozenset({
         "cpi",
         "inflation",
         "unemployment",
@@ -84,9 +116,9 @@ class NewsClassifier:
         "retail sales",
         "housing starts",
         "trade deficit",
-    }
+    })
 
-    POLITICAL_KEYWORDS = {
+    POLITICAL_KEYWORDS = frozenset({
         "congress",
         "senate",
         "house",
@@ -100,9 +132,9 @@ class NewsClassifier:
         "senate confirmed",
         "veto",
         "impeachment",
-    }
+    })
 
-    WEATHER_KEYWORDS = {
+    WEATHER_KEYWORDS = frozenset({
         "hurricane",
         "tornado",
         "blizzard",
@@ -116,9 +148,9 @@ class NewsClassifier:
         "severe weather",
         "noaa",
         "national weather service",
-    }
+    })
 
-    SPORTS_KEYWORDS = {
+    SPORTS_KEYWORDS = frozenset({
         "nfl",
         "nba",
         "mlb",
@@ -131,65 +163,136 @@ class NewsClassifier:
         "trade",
         "mvp",
         "draft",
-    }
+    })
+
+    # Keyword sets by event type, in classification tie-break order
+    KEYWORD_CATEGORIES = (
+        (EventType.ECONOMIC_DATA, ECONOMIC_KEYWORDS),
+        (EventType.POLITICAL, POLITICAL_KEYWORDS),
+        (EventType.WEATHER, WEATHER_KEYWORDS),
+        (EventType.SPORTS, SPORTS_KEYWORDS),
+    )
+
+    # Built after the class body: keyword -> indexes into KEYWORD_CATEGORIES,
+    # and the automaton
+    KEYWORD_CATEGORY_IDS: Dict[str, Tuple[int, ...]] = {}
+    _automaton = None
+
+    @classmethod
+    def find_keywords(cls, text_lower: str) -> List[str]:
+        """
+        Find the distinct known keywords contained in lowercased text.
+
+        Uses one Aho-Corasick pass over the text when pyahocorasick is
+        installed (overlapping matches included, like substring checks).
+
+        Args:
+            text_lower: Lowercased text to scan
+
+        Returns:
+            Matched keywords, each listed once
+        """
+        if cls._automaton is not None:
+            return list(dict.fromkeys(kw for _, kw in cls._automaton.iter(text_lower)))
+
+        # One walk over the flat keyword index; each keyword is checked once
+        # even if it belongs to several categories
+        return [keyword for keyword in cls.KEYWORD_CATEGORY_IDS if keyword in text_lower]
 
     @classmethod
     def classify_event(cls, text: str) -> EventType:
         """Classify news text into event type"""
-        text_lower = text.lower()
-
-        # Count keyword matches for each category
-        scores = {
-            EventType.ECONOMIC_DATA: sum(
-                1 for kw in cls.ECONOMIC_KEYWORDS if kw in text_lower
-            ),
-            EventType.POLITICAL: sum(
-                1 for kw in cls.POLITICAL_KEYWORDS if kw in text_lower
-            ),
-            EventType.WEATHER: sum(
-                1 for kw in cls.WEATHER_KEYWORDS if kw in text_lower
-            ),
-            EventType.SPORTS: sum(
-                1 for kw in cls.SPORTS_KEYWORDS if kw in text_lower
-            ),
-        }
-
-        # Return category with highest score
-        max_category = max(scores.items(), key=lambda x: x[1])
-        if max_category[1] > 0:
-            return max_category[0]
+        return cls._classify_keywords(cls.find_keywords(text.lower()))
+
+    @classmethod
+    def _classify_keywords(cls, found_keywords: List[str]) -> EventType:
+        """Pick the event type with the most matched keywords"""
+        # Count keyword matches per category, indexed like KEYWORD_CATEGORIES
+        scores = [0] * len(cls.KEYWORD_CATEGORIES)
+        for keyword in found_keywords:
+            for category_id in cls.KEYWORD_CATEGORY_IDS[keyword]:
+                scores[category_id] += 1
+
+        # Return category with highest score (first listed wins ties)
+        best = max(range(len(scores)), key=scores.__getitem__)
+        if scores[best] > 0:
+            return cls.KEYWORD_CATEGORIES[best][0]
 
         return EventType.GENERAL
 
     @classmethod
     def extract_keywords(cls, text: str, max_keywords: int = 10) -> List[str]:
         """Extract relevant keywords from text"""
-        text_lower = text.lower()
-        found_keywords = []
-
         # Find all known keywords
-        for keyword_set in [
-            cls.ECONOMIC_KEYWORDS,
-            cls.POLITICAL_KEYWORDS,
-            cls.WEATHER_KEYWORDS,
-            cls.SPORTS_KEYWORDS,
-        ]:
-            for keyword in keyword_set:
-                if keyword in text_lower:
-                    found_keywords.append(keyword)
-
-        # Extract numbers (potential data points)
-        numbers = re.findall(r"\b\d+\.?\d*%?\b", text)
-        found_keywords.extend(numbers[:3])  # Add up to 3 numbers
-
-        return found_keywords[:max_keywords]
+        return cls._add_numbers(cls.find_keywords(text.lower()), text, max_keywords)
+
+    @classmethod
+    def _add_numbers(
+        cls, found_keywords: List[str], text: str, max_keywords: int
+    ) -> List[str]:
+        """Append up to 3 numbers from text to the matched keywords"""
+        room = min(3, max_keywords - len(found_keywords))
+        if room <= 0:
+            return found_keywords[:max_keywords]
+
+        # Extract numbers (potential data points), stopping once there's room
+        numbers = [match.group() for match in islice(_NUMBER_RE.finditer(text), room)]
+        return found_keywords + numbers
 
     @classmethod
     def extract_entities(cls, text: str) -> List[str]:
         """Extract named entities (simplified - would use NLP in production)"""
-        # Simple capitalized word extraction (placeholder for real NER)
-        entities = re.findall(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b", text)
-        return list(set(entities))[:10]
+        # Simple capitalized word extraction (placeholder for real NER);
+        # stream matches and stop at the first 10 distinct ones
+        entities: Dict[str, None] = {}
+        for match in _ENTITY_RE.finditer(text):
+            entities[match.group()] = None
+            if len(entities) == 10:
+                break
+        return list(entities)
+
+    @classmethod
+    def analyze(
+        cls, text: str, max_keywords: int = 10
+    ) -> Tuple[EventType, List[str], List[str]]:
+        """
+        Classify text and extract its keywords and entities together.
+
+        The text is lowercased once and a single keyword scan is shared by
+        classification and keyword extraction.
+
+        Args:
+            text: News text
+            max_keywords: Max keywords to return
+
+        Returns:
+            (event_type, keywords, entities)
+        """
+        found_keywords = cls.find_keywords(text.lower())
+        return (
+            cls._classify_keywords(found_keywords),
+            cls._add_numbers(found_keywords, text, max_keywords),
+            cls.extract_entities(text),
+        )
+
+
+def _index_classifier_keywords():
+    """Build NewsClassifier's keyword -> category ids map and matching automaton"""
+    category_ids: Dict[str, Tuple[int, ...]] = {}
+    for category_id, (_, keyword_set) in enumerate(NewsClassifier.KEYWORD_CATEGORIES):
+        for keyword in keyword_set:
+            category_ids[keyword] = category_ids.get(keyword, ()) + (category_id,)
+    NewsClassifier.KEYWORD_CATEGORY_IDS = category_ids
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword in category_ids:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        NewsClassifier._automaton = automaton
+
+
+_index_classifier_keywords()
 
 
 class TwitterMonitor:
@@ -199,7 +302,9 @@ class TwitterMonitor:
         self.bearer_token = bearer_token
         self.accounts = accounts
         self.client = None
-        self.seen_tweets: Set[str] = set()
+        self.seen_tweets: LRUCache = LRUCache(maxsize=SEEN_TWEETS_MAXSIZE)
+        # username -> user id; ids never change, so look each up only once
+        self._user_ids: Dict[str, str] = {}
 
         # Initialize Tweepy client
         if not tweepy:
@@ -219,26 +324,30 @@ class TwitterMonitor:
             return []
 
         events = []
-        cutoff_time = datetime.utcnow() - timedelta(minutes=5)
+        # Epoch-seconds cutoff: works for tweepy's tz-aware created_at, which
+        # can't be compared against a naive utcnow()
+        cutoff_ts = time.time() - 5 * 60
 
         try:
-            for account in self.accounts:
-                # Get user ID
-                user = self.client.get_user(username=account)
-                if not user.data:
-                    continue
+            # Tweepy's client is blocking: run each account's lookups in a
+            # worker thread so the round trips overlap instead of queueing
+            results = await asyncio.gather(
+                *(
+                    asyncio.to_thread(self._fetch_account_tweets, account)
+                    for account in self.accounts
+                ),
+                return_exceptions=True,
+            )
 
-                # Get recent tweets
-                tweets = self.client.get_users_tweets(
-                    id=user.data.id,
-                    max_results=10,
-                    tweet_fields=["created_at", "text"],
-                )
+            for account, tweets in zip(self.accounts, results):
+                if isinstance(tweets, Exception):
+                    logger.error(f"Error fetching tweets for @{account}: {tweets}")
+                    continue
 
-                if not tweets.data:
+                if not tweets:
                     continue
 
-                for tweet in tweets.data:
+                for tweet in tweets:
                     tweet_id = str(tweet.id)
 
                     # Skip if already seen
@@ -246,22 +355,23 @@ class TwitterMonitor:
                         continue
 
                     # Skip if too old
-                    if tweet.created_at < cutoff_time:
+                    if tweet.created_at.timestamp() < cutoff_ts:
                         continue
 
                     # Mark as seen
-                    self.seen_tweets.add(tweet_id)
+                    self.seen_tweets[tweet_id] = True
 
                     # Create event
+                    event_type, keywords, entities = NewsClassifier.analyze(tweet.text)
                     event = NewsEvent(
                         event_id=f"twitter_{tweet_id}",
                         timestamp=tweet.created_at,
                         source=f"twitter_@{account}",
-                        event_type=NewsClassifier.classify_event(tweet.text),
+                        event_type=event_type,
                         headline=tweet.text[:100],
                         content=tweet.text,
-                        keywords=NewsClassifier.extract_keywords(tweet.text),
-                        entities=NewsClassifier.extract_entities(tweet.text),
+                        keywords=keywords,
+                        entities=entities,
                         related_tickers=[],
                         reliability_score=0.8,  # High for verified news accounts
                         url=f"https://twitter.com/{account}/status/{tweet_id}",
@@ -276,6 +386,32 @@ class TwitterMonitor:
             logger.error(f"Error fetching tweets: {e}")
             return []
 
+    def _fetch_account_tweets(self, account: str) -> List[Any]:
+        """
+        Fetch an account's latest tweets (blocking; run via asyncio.to_thread).
+
+        Args:
+            account: Twitter username without the @
+
+        Returns:
+            Tweet objects, newest first (empty if the user or tweets are missing)
+        """
+        # Get user ID (cached after the first successful lookup)
+        user_id = self._user_ids.get(account)
+        if user_id is None:
+            user = self.client.get_user(username=account)
+            if not user.data:
+                return []
+            user_id = self._user_ids[account] = user.data.id
+
+        # Get recent tweets
+        tweets = self.client.get_users_tweets(
+            id=user_id,
+            max_results=10,
+            tweet_fields=["created_at", "text"],
+        )
+        return tweets.data or []
+
 
 class NewsAPIMonitor:
     """Monitor NewsAPI.org for breaking news"""
@@ -283,7 +419,9 @@ class NewsAPIMonitor:
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.client = None
-        self.seen_articles: Set[str] = set()
+        self.seen_articles: TTLCache = TTLCache(
+            maxsize=SEEN_IDS_MAXSIZE, ttl=SEEN_IDS_TTL_SECONDS
+        )
 
         if not NewsApiClient:
             logger.warning("newsapi-python not installed - NewsAPI monitoring disabled")
@@ -316,14 +454,14 @@ class NewsAPIMonitor:
             for article in articles:
                 article_url = article.get("url", "")
 
-                # Create unique ID from URL
-                article_id = hashlib.md5(article_url.encode()).hexdigest()
+                # Create unique ID from URL (fast non-cryptographic 64-bit hash)
+                article_id = xxhash.xxh3_64_intdigest(article_url.encode())
 
                 # Skip if already seen
                 if article_id in self.seen_articles:
                     continue
 
-                self.seen_articles.add(article_id)
+                self.seen_articles[article_id] = True
 
                 # Parse published date
                 published_at = article.get("publishedAt")
@@ -338,16 +476,17 @@ class NewsAPIMonitor:
                 title = article.get("title", "")
                 description = article.get("description", "")
                 content = f"{title}. {description}"
+                event_type, keywords, entities = NewsClassifier.analyze(content)
 
                 event = NewsEvent(
-                    event_id=f"newsapi_{article_id}",
+                    event_id=f"newsapi_{article_id:016x}",
                     timestamp=timestamp,
                     source=f"newsapi_{article.get('source', {}).get('name', 'unknown')}",
-                    event_type=NewsClassifier.classify_event(content),
+                    event_type=event_type,
                     headline=title,
                     content=content,
-                    keywords=NewsClassifier.extract_keywords(content),
-                    entities=NewsClassifier.extract_entities(content),
+                    keywords=keywords,
+                    entities=entities,
                     related_tickers=[],
                     reliability_score=0.7,
                     url=article_url,
@@ -363,12 +502,42 @@ class NewsAPIMonitor:
             return []
 
 
-class AlphaVantageMonitor:
+def _json(response: httpx.Response) -> Dict:
+    """Decode a JSON response body, using orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+class _PooledHTTPMonitor:
+    """Mixin giving a monitor one long-lived httpx client across polls"""
+
+    _http: Optional[httpx.AsyncClient] = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the shared async HTTP client, creating it on first use"""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=HTTP_TIMEOUT_SECONDS,
+                limits=httpx.Limits(max_keepalive_connections=HTTP_MAX_KEEPALIVE),
+            )
+        return self._http
+
+    async def aclose(self):
+        """Close the shared HTTP client, if it was created"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+
+class AlphaVantageMonitor(_PooledHTTPMonitor):
     """Monitor Alpha Vantage news sentiment"""
 
     def __init__(self, api_key: str):
         self.api_key = api_key
-        self.seen_articles: Set[str] = set()
+        self.seen_articles: TTLCache = TTLCache(
+            maxsize=SEEN_IDS_MAXSIZE, ttl=SEEN_IDS_TTL_SECONDS
+        )
         self.base_url = "https://www.alphavantage.co/query"
 
     async def fetch_news_sentiment(
@@ -384,62 +553,73 @@ class AlphaVantageMonitor:
         events = []
 
         try:
-            async with httpx.AsyncClient() as client:
-                for topic in topics:
-                    params = {
-                        "function": "NEWS_SENTIMENT",
-                        "topics": topic,
-                        "apikey": self.api_key,
-                    }
-
-                    response = await client.get(self.base_url, params=params)
-                    data = response.json()
-
-                    feed = data.get("feed", [])
-
-                    for article in feed[:10]:  # Limit to 10 per topic
-                        article_url = article.get("url", "")
-                        article_id = hashlib.md5(article_url.encode()).hexdigest()
-
-                        if article_id in self.seen_articles:
-                            continue
-
-                        self.seen_articles.add(article_id)
-
-                        # Parse timestamp
-                        time_published = article.get("time_published", "")
-                        try:
-                            timestamp = datetime.strptime(
-                                time_published, "%Y%m%dT%H%M%S"
-                            )
-                        except:
-                            timestamp = datetime.utcnow()
-
-                        title = article.get("title", "")
-                        summary = article.get("summary", "")
-                        content = f"{title}. {summary}"
-
-                        # Get sentiment score
-                        sentiment_score = float(
-                            article.get("overall_sentiment_score", 0)
-                        )
-                        reliability = 0.6 + abs(sentiment_score) * 0.3  # 0.6-0.9
-
-                        event = NewsEvent(
-                            event_id=f"alphavantage_{article_id}",
-                            timestamp=timestamp,
-                            source="alphavantage",
-                            event_type=NewsClassifier.classify_event(content),
-                            headline=title,
-                            content=content,
-                            keywords=NewsClassifier.extract_keywords(content),
-                            entities=NewsClassifier.extract_entities(content),
-                            related_tickers=[],
-                            reliability_score=reliability,
-                            url=article_url,
-                            raw_data=article,
+            client = self._get_http_client()
+            # Request all topics concurrently; results keep topic order
+            responses = await asyncio.gather(
+                *(
+                    client.get(
+                        self.base_url,
+                        params={
+                            "function": "NEWS_SENTIMENT",
+                            "topics": topic,
+                            "apikey": self.api_key,
+                        },
+                    )
+                    for topic in topics
+                )
+            )
+
+            for response in responses:
+                data = _json(response)
+
+                feed = data.get("feed", [])
+
+                for article in feed[:10]:  # Limit to 10 per topic
+                    article_url = article.get("url", "")
+                    article_id = xxhash.xxh3_64_intdigest(article_url.encode())
+
+                    if article_id in self.seen_articles:
+                        continue
+
+                    self.seen_articles[article_id] = True
+
+                    # Parse fixed-width "YYYYMMDDTHHMMSS" by slicing (strptime
+                    # goes through a pure-Python parser per call)
+                    t = article.get("time_published", "")
+                    try:
+                        timestamp = datetime(
+                            int(t[0:4]), int(t[4:6]), int(t[6:8]),
+                            int(t[9:11]), int(t[11:13]), int(t[13:15]),
                         )
-                        events.append(event)
+                    except (TypeError, ValueError):
+                        timestamp = datetime.utcnow()
+
+                    title = article.get("title", "")
+                    summary = article.get("summary", "")
+                    content = f"{title}. {summary}"
+                    event_type, keywords, entities = NewsClassifier.analyze(content)
+
+                    # Get sentiment score
+                    sentiment_score = float(
+                        article.get("overall_sentiment_score", 0)
+                    )
+                    reliability = 0.6 + abs(sentiment_score) * 0.3  # 0.6-0.9
+
+                    event = NewsEvent(
+                        event_id=f"alphavantage_{article_id:016x}",
+                        timestamp=timestamp,
+                        source="alphavantage",
+                        event_type=event_type,
+                        headline=title,
+                        content=content,
+                        keywords=keywords,
+                        entities=entities,
+                        related_tickers=[],
+                        reliability_score=reliability,
+                        url=article_url,
+                        raw_data=article,
+                    )
+                    events.append(event)
 
             logger.debug(f"Fetched {len(events)} new articles from Alpha Vantage")
             return events
@@ -449,63 +629,65 @@ class AlphaVantageMonitor:
             return []
 
 
-class WeatherAlertMonitor:
+class WeatherAlertMonitor(_PooledHTTPMonitor):
     """Monitor NOAA weather alerts"""
 
     def __init__(self):
         self.base_url = "https://api.weather.gov/alerts/active"
-        self.seen_alerts: Set[str] = set()
+        self.seen_alerts: TTLCache = TTLCache(
+            maxsize=SEEN_IDS_MAXSIZE, ttl=SEEN_IDS_TTL_SECONDS
+        )
 
     async def fetch_active_alerts(self) -> List[NewsEvent]:
         """Fetch active weather alerts from NOAA"""
         events = []
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    self.base_url,
-                    params={"status": "actual", "message_type": "alert"},
-                )
-                data = response.json()
+            response = await self._get_http_client().get(
+                self.base_url,
+                params={"status": "actual", "message_type": "alert"},
+            )
+            data = _json(response)
 
-                features = data.get("features", [])
+            features = data.get("features", [])
 
-                for feature in features:
-                    properties = feature.get("properties", {})
+            for feature in features:
+                properties = feature.get("properties", {})
 
-                    alert_id = properties.get("id", "")
-                    if alert_id in self.seen_alerts:
-                        continue
+                alert_id = properties.get("id", "")
+                if alert_id in self.seen_alerts:
+                    continue
 
-                    self.seen_alerts.add(alert_id)
+                self.seen_alerts[alert_id] = True
 
-                    # Parse sent time
-                    sent = properties.get("sent", "")
-                    try:
-                        timestamp = datetime.fromisoformat(sent.replace("Z", "+00:00"))
-                    except:
-                        timestamp = datetime.utcnow()
+                # Parse sent time
+                # A null "sent" becomes "" so it falls back like any bad value
+                sent = properties.get("sent") or ""
+                try:
+                    timestamp = datetime.fromisoformat(sent.replace("Z", "+00:00"))
+                except (TypeError, ValueError):
+                    timestamp = datetime.utcnow()
 
-                    event_name = properties.get("event", "")
-                    headline = properties.get("headline", "")
-                    description = properties.get("description", "")
+                event_name = properties.get("event", "")
+                headline = properties.get("headline", "")
+                description = properties.get("description", "")
 
-                    content = f"{event_name}: {headline}"
+                content = f"{event_name}: {headline}"
 
-                    event = NewsEvent(
-                        event_id=f"weather_{alert_id}",
-                        timestamp=timestamp,
-                        source="noaa",
-                        event_type=EventType.WEATHER,
-                        headline=headline,
-                        content=content,
-                        keywords=[event_name.lower()],
-                        entities=[properties.get("areaDesc", "")],
-                        related_tickers=[],
-                        reliability_score=0.95,  # NOAA is highly reliable
-                        raw_data=properties,
-                    )
-                    events.append(event)
+                event = NewsEvent(
+                    event_id=f"weather_{alert_id}",
+                    timestamp=timestamp,
+                    source="noaa",
+                    event_type=EventType.WEATHER,
+                    headline=headline,
+                    content=content,
+                    keywords=[event_name.lower()],
+                    entities=[properties.get("areaDesc", "")],
+                    related_tickers=[],
+                    reliability_score=0.95,  # NOAA is highly reliable
+                    raw_data=properties,
+                )
+                events.append(event)
 
             logger.debug(f"Fetched {len(events)} new weather alerts")
             return events
@@ -586,12 +768,15 @@ class NewsMonitor:
             f"(source: {event.source}, reliability: {event.reliability_score:.2f})"
         )
 
-        # Call all registered callbacks
-        for callback in self.event_callbacks:
-            try:
-                await callback(event)
-            except Exception as e:
-                logger.error(f"Error in event callback: {e}")
+        # Call all registered callbacks concurrently; they are independent
+        # sinks, so one doing I/O shouldn't hold up the others
+        results = await asyncio.gather(
+            *(callback(event) for callback in self.event_callbacks),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error in event callback: {result}")
 
     async def _poll_twitter(self):
         """Poll Twitter feed"""
@@ -687,3 +872,7 @@ class NewsMonitor:
         """Stop monitoring"""
         logger.info("Stopping news monitoring...")
         self.running = False
+
+        for monitor in (self.alphavantage_monitor, self.weather_monitor):
+            if monitor:
+                await monitor.aclose()
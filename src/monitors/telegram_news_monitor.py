@@ -8,7 +8,8 @@ This is the SECRET WEAPON - free, real-time, filtered news that's as good as Twi
 import asyncio
 import logging
 from datetime import datetime
-from typing import List, Optional, Callable
+from functools import lru_cache
+from typing import List, Optional, Callable, Tuple
 import re
 
 try:
@@ -24,6 +25,96 @@ from src.monitors.news_monitor import NewsEvent, EventType, NewsClassifier
 logger = logging.getLogger(__name__)
 
 
+class _GapPattern:
+    """
+    Regex of the form ``a.*?b.*?c`` evaluated as successive searches.
+
+    Each stage is searched for from where the previous one ended, one line at
+    a time (``.`` never crosses a newline). Only the final stage may run past
+    the line break, so a pattern such as ``(\d+)\s?bps`` still matches a
+    number whose unit is on the next line. This finds the same match as the
+    single lazy-gap regex, but in linear time; the combined regex backtracks
+    through every gap and goes cubic on long lines with no final match.
+    """
+
+    __slots__ = ("_lead", "_last")
+
+    def __init__(self, *stages: str):
+        compiled = tuple(re.compile(stage, re.IGNORECASE) for stage in stages)
+        self._lead, self._last = compiled[:-1], compiled[-1]
+
+    def search(self, text: str) -> Optional[re.Match]:
+        """Return the final stage's match (carrying the value group), or None"""
+        line_start = 0
+        while line_start <= len(text):
+            line_end = text.find("\n", line_start)
+            if line_end == -1:
+                line_end = len(text)
+
+            pos = line_start
+            for stage in self._lead:
+                match = stage.search(text, pos, line_end)
+                if match is None:
+                    break
+                pos = match.end()
+            else:
+                # The final stage must start on this line but may end past it
+                match = self._last.search(text, pos)
+                if match is None:
+                    return None
+                if match.start() <= line_end:
+                    return match
+                # No line before the one holding this match can finish either
+                line_end = text.rfind("\n", 0, match.start())
+
+            line_start = line_end + 1
+        return None
+
+
+# Economic data patterns for TelegramNewsParser, tried in order per metric
+_PERCENT = r"(\d+\.?\d*)%"
+
+_CPI_PATTERNS = [
+    _GapPattern("CPI", _PERCENT),
+    _GapPattern("inflation", _PERCENT),
+    _GapPattern("consumer price", _PERCENT),
+]
+_CPI_EXPECTED_PATTERN = _GapPattern("expected|est|forecast", _PERCENT)
+
+_UNEMPLOYMENT_PATTERNS = [
+    _GapPattern("unemployment", _PERCENT),
+    _GapPattern("jobless", _PERCENT),
+]
+_UNEMPLOYMENT_EXPECTED_PATTERN = _GapPattern("expected|est", _PERCENT)
+
+_FED_RATE_PATTERNS = [
+    _GapPattern(
+        "fed|federal reserve",
+        "raises|cuts|hikes",
+        r"(\d+)(?:\s)?(?:bp|bps|basis points)",
+    ),
+    _GapPattern("interest rate", _PERCENT),
+]
+
+
+@lru_cache(maxsize=2048)
+def _analyze_text(text: str) -> Tuple[EventType, Tuple[str, ...], Tuple[str, ...]]:
+    """
+    NewsClassifier.analyze, memoized on the message text.
+
+    Channels relay the same headline (e.g. one CPI print posted by several
+    bots), so repeats skip classification. Tuples keep cached values immutable.
+    """
+    event_type, keywords, entities = NewsClassifier.analyze(text)
+    return event_type, tuple(keywords), tuple(entities)
+
+
+# Urgency signals for TelegramNewsParser.detect_urgency
+_URGENT_KEYWORDS = ('breaking', 'alert', 'urgent', 'just in', 'now')
+_URGENT_EMOJIS = ('🚨', '⚡', '🔥', '📊', '💥', '⚠️')
+_CAPS_WORD_RE = re.compile(r'\b[A-Z]{3,}\b')
+
+
 class TelegramNewsMonitor:
     """
     Monitor Telegram channels for breaking news in real-time.
@@ -88,15 +179,18 @@ class TelegramNewsMonitor:
         await self.client.start(phone=self.phone)
         logger.info("Telegram client started and authenticated")
 
-        # Get channel entities
+        # Get channel entities (resolved concurrently)
+        results = await asyncio.gather(
+            *(self.client.get_entity(channel) for channel in self.channels),
+            return_exceptions=True,
+        )
         channel_entities = []
-        for channel in self.channels:
-            try:
-                entity = await self.client.get_entity(channel)
-                channel_entities.append(entity)
+        for channel, result in zip(self.channels, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to get channel {channel}: {result}")
+            else:
+                channel_entities.append(result)
                 logger.info(f"Monitoring channel: {channel}")
-            except Exception as e:
-                logger.error(f"Failed to get channel {channel}: {e}")
 
         if not channel_entities:
             logger.error("No valid channels to monitor")
@@ -126,12 +220,14 @@ class TelegramNewsMonitor:
             event = self._parse_message(text, message)
 
             if event:
-                # Call all registered callbacks
-                for callback in self.callbacks:
-                    try:
-                        await callback(event)
-                    except Exception as e:
-                        logger.error(f"Error in callback: {e}")
+                # Call all registered callbacks concurrently
+                results = await asyncio.gather(
+                    *(callback(event) for callback in self.callbacks),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.error(f"Error in callback: {result}")
 
         except Exception as e:
             logger.error(f"Error processing message: {e}")
@@ -142,14 +238,8 @@ class TelegramNewsMonitor:
         # Generate unique event ID
         event_id = f"telegram_{message.chat_id}_{message.id}"
 
-        # Classify event type
-        event_type = NewsClassifier.classify_event(text)
-
-        # Extract keywords
-        keywords = NewsClassifier.extract_keywords(text)
-
-        # Extract entities
-        entities = NewsClassifier.extract_entities(text)
+        # Classify event type and extract keywords/entities in one pass
+        event_type, keywords, entities = _analyze_text(text)
 
         # Create NewsEvent
         event = NewsEvent(
@@ -159,8 +249,8 @@ class TelegramNewsMonitor:
             event_type=event_type,
             headline=text[:200],  # First 200 chars as headline
             content=text,
-            keywords=keywords,
-            entities=entities,
+            keywords=list(keywords),
+            entities=list(entities),
             related_tickers=[],
             reliability_score=0.9,  # High reliability for curated channels
             url=None,
@@ -192,19 +282,13 @@ class TelegramNewsParser:
         """Extract economic data from Telegram message"""
 
         # CPI patterns
-        cpi_patterns = [
-            r'CPI.*?(\d+\.?\d*)%',
-            r'inflation.*?(\d+\.?\d*)%',
-            r'consumer price.*?(\d+\.?\d*)%',
-        ]
-
-        for pattern in cpi_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _CPI_PATTERNS:
+            match = pattern.search(text)
             if match:
                 value = float(match.group(1))
 
                 # Try to extract expected value
-                expected_match = re.search(r'(?:expected|est|forecast).*?(\d+\.?\d*)%', text, re.IGNORECASE)
+                expected_match = _CPI_EXPECTED_PATTERN.search(text)
                 expected = float(expected_match.group(1)) if expected_match else None
 
                 return {
@@ -215,16 +299,11 @@ class TelegramNewsParser:
                 }
 
         # Unemployment patterns
-        unemp_patterns = [
-            r'unemployment.*?(\d+\.?\d*)%',
-            r'jobless.*?(\d+\.?\d*)%',
-        ]
-
-        for pattern in unemp_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _UNEMPLOYMENT_PATTERNS:
+            match = pattern.search(text)
             if match:
                 value = float(match.group(1))
-                expected_match = re.search(r'(?:expected|est).*?(\d+\.?\d*)%', text, re.IGNORECASE)
+                expected_match = _UNEMPLOYMENT_EXPECTED_PATTERN.search(text)
                 expected = float(expected_match.group(1)) if expected_match else None
 
                 return {
@@ -235,13 +314,8 @@ class TelegramNewsParser:
                 }
 
         # Fed rate patterns
-        rate_patterns = [
-            r'(?:fed|federal reserve).*?(?:raises|cuts|hikes).*?(\d+)(?:\s)?(?:bp|bps|basis points)',
-            r'interest rate.*?(\d+\.?\d*)%',
-        ]
-
-        for pattern in rate_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _FED_RATE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 value = float(match.group(1))
 
@@ -263,20 +337,19 @@ class TelegramNewsParser:
         """
         score = 0.5  # Base score
 
-        # Urgency indicators
-        urgent_keywords = ['breaking', 'alert', 'urgent', 'just in', 'now']
-        for keyword in urgent_keywords:
-            if keyword.lower() in text.lower():
+        # Urgency indicators (lowercase the text once, not per keyword)
+        text_lower = text.lower()
+        for keyword in _URGENT_KEYWORDS:
+            if keyword in text_lower:
                 score += 0.1
 
         # Emoji indicators (often used for important news)
-        urgent_emojis = ['🚨', '⚡', '🔥', '📊', '💥', '⚠️']
-        for emoji in urgent_emojis:
+        for emoji in _URGENT_EMOJIS:
             if emoji in text:
                 score += 0.05
 
         # ALL CAPS words (usually important)
-        caps_words = re.findall(r'\b[A-Z]{3,}\b', text)
+        caps_words = _CAPS_WORD_RE.findall(text)
         if len(caps_words) > 2:
             score += 0.1
 
@@ -315,9 +388,14 @@ async def integrate_telegram_monitor(
 
     # Register callback to feed events to main news monitor
     async def forward_to_main(event: NewsEvent):
-        # Process event through main news monitor's callbacks
-        for callback in main_news_monitor.event_callbacks:
-            await callback(event)
+        # Process event through main news monitor's callbacks concurrently
+        results = await asyncio.gather(
+            *(callback(event) for callback in main_news_monitor.event_callbacks),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error in main monitor callback: {result}")
 
     telegram_monitor.register_callback(forward_to_main)
 
@@ -2,68 +2,127 @@
 Unit tests for Kalshi API client
 """
 
+import asyncio
+import json
+
+import httpx
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+import respx
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
 from datetime import datetime
 
 from src.api.kalshi_client import KalshiClient, Market, Order, Position
 
+BASE_URL = "https://demo-api.kalshi.co/trade-api/v2"
+
+
+@pytest.fixture(scope="module")
+def private_key_pem():
+    """Throwaway RSA key so requests are signed for real"""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.TraditionalOpenSSL,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+
 
 class TestKalshiClient:
     """Test Kalshi API client functionality"""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create a mock Kalshi client"""
-        with patch('httpx.Client'):
-            client = KalshiClient(
-                api_key="test_key",
-                api_secret="test_secret",
-                base_url="https://demo-api.kalshi.co/trade-api/v2"
-            )
-            return client
-
-    def test_authentication(self, mock_client):
-        """Test authentication flow"""
-        # Mock successful auth response
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "token": "test_token_12345"
-        }
-        mock_response.raise_for_status = Mock()
-
-        with patch.object(mock_client.client, 'post', return_value=mock_response):
-            token = mock_client.authenticate()
-
-            assert token == "test_token_12345"
-            assert mock_client.token == "test_token_12345"
-            assert mock_client.token_expiry is not None
-
+    @pytest.fixture(scope="module")
+    def mock_client(self, private_key_pem):
+        """Create one Kalshi client for the module; respx intercepts its transport"""
+        client = KalshiClient(
+            api_key="test_key",
+            api_secret=private_key_pem,
+            base_url=BASE_URL
+        )
+        yield client
+        client.close()
+
+    @pytest.fixture(autouse=True)
+    def _reset_client(self, mock_client):
+        """Clear per-test client state (market cache, rate-limit slot)"""
+        mock_client._invalidate_markets_cache()
+        mock_client.last_request_time = float("-inf")
+        yield
+
+    @staticmethod
+    def run_async(client, coro):
+        """Run an async client call, closing the pooled AsyncClient on the same loop"""
+        async def run():
+            try:
+                return await coro
+            finally:
+                await client.aclose()
+
+        return asyncio.run(run())
+
+    @respx.mock
     def test_get_markets(self, mock_client):
         """Test fetching markets"""
         # Mock response
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "markets": [
-                {
-                    "ticker": "INX-23DEC29-T4700",
-                    "title": "S&P 500 above 4700",
-                    "status": "open",
-                    "last_price": 0.65,
-                }
-            ]
-        }
-        mock_response.raise_for_status = Mock()
+        respx.get(f"{BASE_URL}/markets").mock(
+            return_value=httpx.Response(200, json={
+                "markets": [
+                    {
+                        "ticker": "INX-23DEC29-T4700",
+                        "title": "S&P 500 above 4700",
+                        "status": "open",
+                        "last_price": 0.65,
+                    }
+                ]
+            })
+        )
 
         mock_client.token = "test_token"
         mock_client.token_expiry = datetime(2099, 1, 1)
 
-        with patch.object(mock_client.client, 'request', return_value=mock_response):
-            markets = mock_client.get_markets(status="open")
-
-            assert len(markets) == 1
-            assert markets[0].ticker == "INX-23DEC29-T4700"
-            assert markets[0].last_price == 0.65
+        markets = mock_client.get_markets(status="open")
+
+        assert len(markets) == 1
+        assert markets[0].ticker == "INX-23DEC29-T4700"
+        assert markets[0].last_price == 0.65
+
+    @respx.mock
+    def test_get_markets_cached(self, mock_client):
+        """Test repeated market listings reuse the cached response"""
+        route = respx.get(f"{BASE_URL}/markets").mock(
+            return_value=httpx.Response(200, json={
+                "markets": [{"ticker": "TEST-A", "title": "Market A", "status": "open"}]
+            })
+        )
+
+        first = mock_client.get_markets(status="open", use_cache=True)
+        second = mock_client.get_markets(status="open", use_cache=True)
+        assert route.call_count == 1
+        assert [m.ticker for m in second] == [m.ticker for m in first]
+
+        # Different parameters and the uncached default both hit the API
+        mock_client.get_markets(status="closed", use_cache=True)
+        mock_client.get_markets(status="open")
+        assert route.call_count == 3
+
+    @respx.mock
+    def test_get_markets_by_ticker(self, mock_client):
+        """Test batched market fetch by ticker"""
+        route = respx.get(f"{BASE_URL}/markets").mock(
+            return_value=httpx.Response(200, json={
+                "markets": [
+                    {"ticker": "TEST-A", "title": "Market A", "status": "open"},
+                    {"ticker": "TEST-B", "title": "Market B", "status": "closed"},
+                ]
+            })
+        )
+
+        markets = mock_client.get_markets_by_ticker(["TEST-A", "TEST-B", "TEST-A"])
+
+        assert route.call_count == 1
+        assert route.calls.last.request.url.params["tickers"] == "TEST-A,TEST-B"
+        assert set(markets) == {"TEST-A", "TEST-B"}
+        assert markets["TEST-B"].status == "closed"
 
     def test_place_order_validation(self, mock_client):
         """Test order validation"""
@@ -79,31 +138,80 @@ class TestKalshiClient:
         with pytest.raises(ValueError, match="Invalid quantity"):
             mock_client.place_order("TEST", "yes", -5, 50)
 
+    @respx.mock
     def test_place_order_success(self, mock_client):
         """Test successful order placement"""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "order": {
-                "order_id": "order_123",
-                "ticker": "TEST",
-                "side": "yes",
-                "count": 10,
-                "price": 50,
-                "status": "resting"
-            }
-        }
-        mock_response.raise_for_status = Mock()
+        respx.post(f"{BASE_URL}/portfolio/orders").mock(
+            return_value=httpx.Response(200, json={
+                "order": {
+                    "order_id": "order_123",
+                    "ticker": "TEST",
+                    "side": "yes",
+                    "count": 10,
+                    "price": 50,
+                    "status": "resting"
+                }
+            })
+        )
 
         mock_client.token = "test_token"
         mock_client.token_expiry = datetime(2099, 1, 1)
 
-        with patch.object(mock_client.client, 'request', return_value=mock_response):
-            order = mock_client.place_order("TEST", "yes", 10, 50)
+        order = mock_client.place_order("TEST", "yes", 10, 50)
+
+        assert order is not None
+        assert order.order_id == "order_123"
+        assert order.ticker == "TEST"
+        assert order.quantity == 10
+
+    @respx.mock
+    def test_aget_market(self, mock_client):
+        """Test async single market fetch"""
+        route = respx.get(f"{BASE_URL}/markets/TEST-A").mock(
+            return_value=httpx.Response(200, json={
+                "market": {"ticker": "TEST-A", "title": "Market A", "status": "open"}
+            })
+        )
+
+        market = self.run_async(mock_client, mock_client.aget_market("TEST-A"))
+
+        assert route.call_count == 1
+        assert "KALSHI-ACCESS-SIGNATURE" in route.calls.last.request.headers
+        assert market.ticker == "TEST-A"
+
+    @respx.mock
+    def test_aget_market_not_found(self, mock_client):
+        """Test async market fetch swallows HTTP errors"""
+        respx.get(f"{BASE_URL}/markets/MISSING").mock(return_value=httpx.Response(404))
+
+        assert self.run_async(mock_client, mock_client.aget_market("MISSING")) is None
+
+    @respx.mock
+    def test_aplace_order_success(self, mock_client):
+        """Test async order placement"""
+        route = respx.post(f"{BASE_URL}/portfolio/orders").mock(
+            return_value=httpx.Response(200, json={
+                "order": {
+                    "order_id": "order_456",
+                    "ticker": "TEST",
+                    "side": "no",
+                    "count": 5,
+                    "price": 40,
+                    "status": "resting"
+                }
+            })
+        )
+
+        order = self.run_async(mock_client, mock_client.aplace_order("TEST", "no", 5, 40))
+
+        assert json.loads(route.calls.last.request.content)["no_price"] == 40
+        assert order.order_id == "order_456"
+        assert order.quantity == 5
 
-            assert order is not None
-            assert order.order_id == "order_123"
-            assert order.ticker == "TEST"
-            assert order.quantity == 10
+    def test_aplace_order_validation(self, mock_client):
+        """Test async order validation happens before any request"""
+        with pytest.raises(ValueError, match="Invalid price"):
+            self.run_async(mock_client, mock_client.aplace_order("TEST", "yes", 10, 0))
 
     def test_rate_limiting(self, mock_client):
         """Test rate limiting functionality"""
@@ -0,0 +1,74 @@
+"""
+Unit tests for news monitors
+"""
+
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+import respx
+
+from src.monitors.news_monitor import EventType, WeatherAlertMonitor
+
+NOAA_URL = "https://api.weather.gov/alerts/active"
+
+
+def noaa_alert(alert_id, sent):
+    return {
+        "properties": {
+            "id": alert_id,
+            "sent": sent,
+            "event": "Winter Storm Warning",
+            "headline": f"Alert {alert_id}",
+            "areaDesc": "Cook, IL",
+        }
+    }
+
+
+class TestWeatherAlertMonitor:
+    """NOAA alert parsing"""
+
+    @staticmethod
+    def fetch(monitor):
+        async def run():
+            try:
+                return await monitor.fetch_active_alerts()
+            finally:
+                await monitor.aclose()
+
+        return asyncio.run(run())
+
+    @respx.mock
+    def test_parses_sent_time(self):
+        """ISO-8601 'sent' values become the event timestamp"""
+        respx.get(NOAA_URL).mock(return_value=httpx.Response(200, json={
+            "features": [noaa_alert("a1", "2024-01-15T12:30:00Z")]
+        }))
+
+        events = self.fetch(WeatherAlertMonitor())
+
+        assert len(events) == 1
+        assert events[0].event_type == EventType.WEATHER
+        assert events[0].timestamp.isoformat() == "2024-01-15T12:30:00+00:00"
+
+    @respx.mock
+    @pytest.mark.parametrize("sent", [None, "", "not a date"])
+    def test_bad_sent_time_keeps_alert(self, sent):
+        """Null or malformed 'sent' falls back to now without dropping the batch"""
+        respx.get(NOAA_URL).mock(return_value=httpx.Response(200, json={
+            "features": [
+                noaa_alert("a1", sent),
+                noaa_alert("a2", "2024-01-15T12:30:00Z"),
+            ]
+        }))
+
+        before = datetime.utcnow()
+        events = self.fetch(WeatherAlertMonitor())
+
+        assert [e.event_id for e in events] == ["weather_a1", "weather_a2"]
+        assert events[0].timestamp >= before
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,40 @@
+"""
+Unit tests for the Telegram news parser
+"""
+
+from src.monitors.telegram_news_monitor import TelegramNewsParser
+
+
+class TestExtractEconomicData:
+    """Economic figures pulled from Telegram messages"""
+
+    def test_cpi_with_expected(self):
+        data = TelegramNewsParser.extract_economic_data(
+            "🚨 BREAKING: CPI comes in at 3.5% vs expected 3.2%"
+        )
+
+        assert data["metric"] == "CPI"
+        assert data["actual"] == 3.5
+
+    def test_fed_rate_in_bps(self):
+        data = TelegramNewsParser.extract_economic_data("⚡️ Fed raises rates by 25bps to 5.25%")
+
+        assert data["metric"] == "FED_RATE"
+        assert data["actual"] == 25
+        assert data["unit"] == "bps"
+
+    def test_fed_rate_unit_on_next_line(self):
+        data = TelegramNewsParser.extract_economic_data("Fed cuts rates by 25\nbps")
+
+        assert data["metric"] == "FED_RATE"
+        assert data["actual"] == 25
+
+    def test_fed_rate_basis_points_on_next_line(self):
+        data = TelegramNewsParser.extract_economic_data(
+            "The Fed raises rates 50\nbasis points"
+        )
+
+        assert data["actual"] == 50
+
+    def test_keywords_split_across_lines_do_not_match(self):
+        assert TelegramNewsParser.extract_economic_data("Fed\ncuts rates by 25bps") is None
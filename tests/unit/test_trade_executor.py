@@ -0,0 +1,133 @@
+"""
+Unit tests for the trade executor
+"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.api.kalshi_client import Order
+from src.edge_detection.speed_arbitrage import TradeSignal
+from src.execution.trade_executor import TradeExecutor
+
+
+class SlowKalshi:
+    """Kalshi stand-in whose order call yields to the event loop like a real request"""
+
+    def __init__(self, balance: float = 10000, delay: float = 0.05):
+        self.balance = balance
+        self.delay = delay
+        self.orders = []
+
+    def get_balance(self):
+        return {"balance": self.balance}
+
+    def get_positions(self):
+        return []
+
+    async def aplace_order(self, ticker, side, quantity, limit_price, order_type):
+        await asyncio.sleep(self.delay)
+        self.orders.append((ticker, quantity, limit_price))
+        return Order({
+            "order_id": f"order_{len(self.orders)}",
+            "ticker": ticker,
+            "side": side,
+            "count": quantity,
+            "price": limit_price,
+            "status": "resting",
+        })
+
+
+def make_signal(signal_id: str) -> TradeSignal:
+    return TradeSignal(
+        signal_id=signal_id,
+        timestamp=datetime.now(),
+        source="test",
+        ticker=f"TEST-{signal_id}",
+        side="yes",
+        signal_type="BUY",
+        confidence=0.9,
+        edge_percentage=0.2,
+        current_price=0.5,
+        fair_value=0.7,
+        reasoning="test signal",
+    )
+
+
+def make_executor(kalshi, **overrides) -> TradeExecutor:
+    db = MagicMock()
+    query = db.query.return_value.filter.return_value
+    query.count.return_value = 0
+    query.first.return_value = None
+    config = {
+        "enabled": True,
+        "max_trades_per_hour": 20,
+        "max_position_size_usd": 5000,
+        "max_portfolio_heat": 0.20,  # $2000 of the $10000 balance
+        **overrides,
+    }
+    return TradeExecutor(kalshi, config, db)
+
+
+def run_concurrently(executor, signals):
+    async def run():
+        return await asyncio.gather(*(executor.execute_signal(s) for s in signals))
+
+    return asyncio.run(run())
+
+
+class TestTradeExecutorConcurrency:
+    """execute_signal awaited from several tasks at once"""
+
+    @pytest.fixture
+    def kalshi(self):
+        return SlowKalshi()
+
+    def test_same_signal_executes_once(self, kalshi):
+        """Concurrent copies of one signal place a single order"""
+        executor = make_executor(kalshi)
+
+        results = run_concurrently(executor, [make_signal("dup")] * 4)
+
+        assert len(kalshi.orders) == 1
+        assert sum(r is not None for r in results) == 1
+
+    def test_distinct_signals_respect_hourly_limit(self, kalshi):
+        """Concurrent signals cannot all pass the hourly trade limit"""
+        executor = make_executor(kalshi, max_trades_per_hour=2, max_portfolio_heat=1.0)
+
+        run_concurrently(executor, [make_signal(str(i)) for i in range(6)])
+
+        assert len(kalshi.orders) == 2
+
+    def test_distinct_signals_respect_portfolio_heat(self, kalshi):
+        """Concurrent signals cannot all pass the portfolio heat check"""
+        executor = make_executor(kalshi)
+
+        run_concurrently(executor, [make_signal(str(i)) for i in range(6)])
+
+        placed_usd = sum(q * p / 100 for _, q, p in kalshi.orders)
+        assert placed_usd <= 2000
+        assert executor._current_exposure == pytest.approx(placed_usd)
+
+    def test_alert_does_not_hold_order_lock(self, kalshi):
+        """A slow trade alert does not delay the next signal's order"""
+        executor = make_executor(kalshi)
+        sent = []
+
+        async def slow_alert(message):
+            await asyncio.sleep(0.5)
+            sent.append(len(kalshi.orders))
+
+        executor._send_alert = slow_alert
+
+        run_concurrently(executor, [make_signal("a"), make_signal("b")])
+
+        # Both orders were placed before the first alert finished sending
+        assert sent == [2, 2]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])